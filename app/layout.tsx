@@ -3,6 +3,7 @@ import { Geist, Geist_Mono } from "next/font/google";
 import "./globals.css";
 import AppLayout from "@/components/AppLayout";
 import { ServiceWorkerRegistration } from "@/components/pwa/ServiceWorkerRegistration";
+import appIcons from "@/config/app-icons.json";
 
 const geistSans = Geist({
   variable: "--font-geist-sans",
@@ -18,6 +19,11 @@ export const metadata: Metadata = {
   title: "Peak One - The Operating System for Work",
   description: "Combining secure messaging, video conferencing, AI-powered productivity, project management, and cloud storage in one unified platform",
   manifest: "/manifest.json",
+  // Exact-size icons written by scripts/generate-app-icons.py (favicon: app/favicon.ico)
+  icons: {
+    icon: appIcons.icon,
+    apple: appIcons.apple,
+  },
   appleWebApp: {
     capable: true,
     statusBarStyle: "default",
@@ -59,12 +65,6 @@ export default function RootLayout({
   return (
     <html lang="en" suppressHydrationWarning>
       <head>
-        {/* PWA iOS specific */}
-        <link rel="apple-touch-icon" href="/icons/pwa/icon-192.png" />
-        <link rel="apple-touch-icon" sizes="152x152" href="/icons/pwa/icon-152.png" />
-        <link rel="apple-touch-icon" sizes="180x180" href="/icons/pwa/icon-192.png" />
-        <link rel="apple-touch-icon" sizes="167x167" href="/icons/pwa/icon-192.png" />
-
         {/* iOS splash screens */}
         <meta name="apple-mobile-web-app-capable" content="yes" />
         <meta name="apple-mobile-web-app-status-bar-style" content="black-translucent" />
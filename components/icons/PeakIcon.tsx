@@ -1,4 +1,5 @@
 import Image from 'next/image'
+import { assetEntry, onDemandAssetUrl, themedLogicalUrl, vectorAssetUrl } from '@/lib/assets'
 
 export type IconName =
   | 'logo'
@@ -19,6 +20,8 @@ interface PeakIconProps {
   size?: IconSize
   className?: string
   alt?: string
+  // Color variant from the generators' THEMES table, e.g. 'dark'
+  theme?: string
 }
 
 const iconPaths: Record<IconName, (size: IconSize) => string> = {
@@ -41,8 +44,20 @@ const iconPaths: Record<IconName, (size: IconSize) => string> = {
   settings: () => '/icons/navigation/nav-settings-24.png',
 }
 
-export function PeakIcon({ name, size = 24, className = '', alt }: PeakIconProps) {
-  const iconPath = iconPaths[name](size)
+// Published icon for the logical URL, or - when it or the requested theme hasn't
+// been generated yet - the on-demand service's build of it (development only)
+function resolveIcon(logicalUrl: string, size: IconSize, theme?: string): string {
+  const themed = themedLogicalUrl(logicalUrl, theme)
+  if (assetEntry(logicalUrl) && (!theme || themed !== logicalUrl)) {
+    return vectorAssetUrl(themed)
+  }
+  const assetName = logicalUrl.slice(logicalUrl.lastIndexOf('/') + 1).replace(/\.png$/, '')
+  // Same 2x density the published derivatives are cut at
+  return onDemandAssetUrl(assetName, size * 2, 'webp', theme) ?? vectorAssetUrl(themed)
+}
+
+export function PeakIcon({ name, size = 24, className = '', alt, theme }: PeakIconProps) {
+  const iconPath = resolveIcon(iconPaths[name](size), size, theme)
   const defaultAlt = `${name.charAt(0).toUpperCase() + name.slice(1)} icon`
 
   return (
@@ -53,6 +68,9 @@ export function PeakIcon({ name, size = 24, className = '', alt }: PeakIconProps
       height={size}
       className={className}
       style={{ width: size, height: size }}
+      // SVGs need no resizing; on-demand builds are already cut to size and
+      // come from a local host next/image's optimizer won't fetch from
+      unoptimized={iconPath.endsWith('.svg') || !iconPath.startsWith('/')}
     />
   )
 }
@@ -0,0 +1,57 @@
+// Fingerprinted asset lookup
+// config/asset-map.json is written by scripts/asset_pipeline.py whenever the
+// image generators run. It maps the stable logical URL of each generated asset
+// to its content-hashed URL, which is served with Cache-Control: immutable.
+
+import assetMap from '@/config/asset-map.json'
+
+export interface AssetEntry {
+  url: string
+  hash: string
+  bytes: number
+  // Page surface the generators assigned it to (e.g. 'app-shell')
+  surface?: string
+}
+
+const assets: Record<string, AssetEntry> = assetMap.assets
+
+// Resolve a logical asset URL (e.g. '/icons/navigation/nav-home-24.png') to the
+// fingerprinted file. Unpublished assets fall back to the logical URL.
+export function assetUrl(logicalUrl: string): string {
+  return assets[logicalUrl]?.url ?? logicalUrl
+}
+
+export function assetEntry(logicalUrl: string): AssetEntry | undefined {
+  return assets[logicalUrl]
+}
+
+// Prefer the traced SVG that scripts/vector_trace.py publishes next to flat icons
+// ('/icons/navigation/nav-home-24.png' -> its '.svg' sibling) over the raster.
+export function vectorAssetUrl(logicalUrl: string): string {
+  const vector = assets[logicalUrl.replace(/\.(png|webp|avif)$/, '.svg')]
+  return vector?.url ?? assetUrl(logicalUrl)
+}
+
+// Color variants are recolored from the same master by scripts/image_kernels.py
+// and published as '/icons/navigation/nav-home-24.dark.png' and siblings. Returns
+// the themed logical URL when that theme was generated, the original otherwise.
+export function themedLogicalUrl(logicalUrl: string, theme?: string): string {
+  if (!theme) return logicalUrl
+  const themed = logicalUrl.replace(/\.(png|webp|avif|svg)$/, `.${theme}.$1`)
+  return assets[themed] ? themed : logicalUrl
+}
+
+// Local on-demand service (scripts/serve-assets.py) that builds sizes, formats
+// and themes the generators don't publish. Unset outside development, in which
+// case callers keep to the published assets above.
+const assetServiceUrl = process.env.NEXT_PUBLIC_ASSET_SERVICE_URL
+
+export function onDemandAssetUrl(
+  name: string,
+  size: number,
+  format: 'png' | 'webp' | 'avif' = 'png',
+  theme?: string
+): string | undefined {
+  if (!assetServiceUrl) return undefined
+  return `${assetServiceUrl}/${name}/${size}${theme ? `.${theme}` : ''}.${format}`
+}
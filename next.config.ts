@@ -23,6 +23,17 @@ const nextConfig: NextConfig = {
       { protocol: 'https', hostname: 'avatars.githubusercontent.com' },
     ],
   },
+  async headers() {
+    return [
+      {
+        // Content-hashed outputs of scripts/asset_pipeline.py (see config/asset-map.json)
+        source: '/:dir(icons|graphics)/:group/:file([\\w.-]+\\.[0-9a-f]{8}\\.(?:png|webp|avif|svg))',
+        headers: [
+          { key: 'Cache-Control', value: 'public, max-age=31536000, immutable' },
+        ],
+      },
+    ]
+  },
   experimental: {
     cpus: 1,
     workerThreads: false,
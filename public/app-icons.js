@@ -0,0 +1,16 @@
+// Generated by scripts/generate-app-icons.py - do not edit
+self.__APP_ICONS = {
+  "icon-72.png": "/icons/pwa/icon-72.png?v=6e53980f",
+  "icon-96.png": "/icons/pwa/icon-96.png?v=259ac4a3",
+  "icon-128.png": "/icons/pwa/icon-128.png?v=b018c2dd",
+  "icon-144.png": "/icons/pwa/icon-144.png?v=9ed0cbd6",
+  "icon-152.png": "/icons/pwa/icon-152.png?v=c1e05bc0",
+  "icon-192.png": "/icons/pwa/icon-192.png?v=dbe570f1",
+  "icon-384.png": "/icons/pwa/icon-384.png?v=ce8f33fb",
+  "icon-512.png": "/icons/pwa/icon-512.png?v=26afd9c3",
+  "maskable-icon-192.png": "/icons/pwa/maskable-icon-192.png?v=505ca361",
+  "maskable-icon-512.png": "/icons/pwa/maskable-icon-512.png?v=56576bc8",
+  "apple-touch-icon-180.png": "/icons/pwa/apple-touch-icon-180.png?v=9ee08f0f",
+  "apple-touch-icon-167.png": "/icons/pwa/apple-touch-icon-167.png?v=9e81446a",
+  "apple-touch-icon-152.png": "/icons/pwa/apple-touch-icon-152.png?v=fe2606ee"
+}
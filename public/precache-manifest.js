@@ -0,0 +1,190 @@
+// Generated by scripts/asset_pipeline.py - do not edit
+self.__PRECACHE_MANIFEST = {
+  "revision": "4d7c78bc",
+  "assets": [
+    {
+      "url": "/icons/ai/peak-ai-32.84eb259c.png",
+      "revision": "84eb259c",
+      "bytes": 5951,
+      "variants": [
+        {
+          "url": "/icons/ai/peak-ai-32.3f9536bc.avif",
+          "type": "image/avif",
+          "bytes": 2297
+        },
+        {
+          "url": "/icons/ai/peak-ai-32.bd3b818c.webp",
+          "type": "image/webp",
+          "bytes": 3650
+        },
+        {
+          "url": "/icons/ai/peak-ai-32.84eb259c.png",
+          "type": "image/png",
+          "bytes": 5951
+        }
+      ]
+    },
+    {
+      "url": "/icons/ai/peak-ai-64.af2a9bde.png",
+      "revision": "af2a9bde",
+      "bytes": 12963,
+      "variants": [
+        {
+          "url": "/icons/ai/peak-ai-64.bde9bca8.avif",
+          "type": "image/avif",
+          "bytes": 3740
+        },
+        {
+          "url": "/icons/ai/peak-ai-64.4b25c072.webp",
+          "type": "image/webp",
+          "bytes": 6856
+        },
+        {
+          "url": "/icons/ai/peak-ai-64.af2a9bde.png",
+          "type": "image/png",
+          "bytes": 12963
+        }
+      ]
+    },
+    {
+      "url": "/icons/brand/peak-logo-32.fb178d44.png",
+      "revision": "fb178d44",
+      "bytes": 5024,
+      "variants": [
+        {
+          "url": "/icons/brand/peak-logo-32.971f8807.avif",
+          "type": "image/avif",
+          "bytes": 1590
+        },
+        {
+          "url": "/icons/brand/peak-logo-32.92d4c241.webp",
+          "type": "image/webp",
+          "bytes": 2494
+        },
+        {
+          "url": "/icons/brand/peak-logo-32.fb178d44.png",
+          "type": "image/png",
+          "bytes": 5024
+        }
+      ]
+    },
+    {
+      "url": "/icons/brand/peak-logo-64.b018c2dd.png",
+      "revision": "b018c2dd",
+      "bytes": 13510,
+      "variants": [
+        {
+          "url": "/icons/brand/peak-logo-64.307c0eee.avif",
+          "type": "image/avif",
+          "bytes": 2881
+        },
+        {
+          "url": "/icons/brand/peak-logo-64.199626c4.webp",
+          "type": "image/webp",
+          "bytes": 5144
+        },
+        {
+          "url": "/icons/brand/peak-logo-64.b018c2dd.png",
+          "type": "image/png",
+          "bytes": 13510
+        }
+      ]
+    },
+    {
+      "url": "/icons/navigation/nav-calendar-24.2b86f76f.svg",
+      "revision": "2b86f76f",
+      "bytes": 917,
+      "variants": [
+        {
+          "url": "/icons/navigation/nav-calendar-24.2b86f76f.svg",
+          "type": "image/svg+xml",
+          "bytes": 917
+        }
+      ]
+    },
+    {
+      "url": "/icons/navigation/nav-calls-24.270e7cac.svg",
+      "revision": "270e7cac",
+      "bytes": 520,
+      "variants": [
+        {
+          "url": "/icons/navigation/nav-calls-24.270e7cac.svg",
+          "type": "image/svg+xml",
+          "bytes": 520
+        }
+      ]
+    },
+    {
+      "url": "/icons/navigation/nav-files-24.4cf6b893.svg",
+      "revision": "4cf6b893",
+      "bytes": 367,
+      "variants": [
+        {
+          "url": "/icons/navigation/nav-files-24.4cf6b893.svg",
+          "type": "image/svg+xml",
+          "bytes": 367
+        }
+      ]
+    },
+    {
+      "url": "/icons/navigation/nav-home-24.6998605c.svg",
+      "revision": "6998605c",
+      "bytes": 547,
+      "variants": [
+        {
+          "url": "/icons/navigation/nav-home-24.6998605c.svg",
+          "type": "image/svg+xml",
+          "bytes": 547
+        }
+      ]
+    },
+    {
+      "url": "/icons/navigation/nav-meetings-24.577be82c.svg",
+      "revision": "577be82c",
+      "bytes": 422,
+      "variants": [
+        {
+          "url": "/icons/navigation/nav-meetings-24.577be82c.svg",
+          "type": "image/svg+xml",
+          "bytes": 422
+        }
+      ]
+    },
+    {
+      "url": "/icons/navigation/nav-messages-24.978da0d0.svg",
+      "revision": "978da0d0",
+      "bytes": 354,
+      "variants": [
+        {
+          "url": "/icons/navigation/nav-messages-24.978da0d0.svg",
+          "type": "image/svg+xml",
+          "bytes": 354
+        }
+      ]
+    },
+    {
+      "url": "/icons/navigation/nav-settings-24.445ffdf9.svg",
+      "revision": "445ffdf9",
+      "bytes": 871,
+      "variants": [
+        {
+          "url": "/icons/navigation/nav-settings-24.445ffdf9.svg",
+          "type": "image/svg+xml",
+          "bytes": 871
+        }
+      ]
+    },
+    {
+      "url": "/icons/navigation/nav-tasks-24.e200f70b.svg",
+      "revision": "e200f70b",
+      "bytes": 328,
+      "variants": [
+        {
+          "url": "/icons/navigation/nav-tasks-24.e200f70b.svg",
+          "type": "image/svg+xml",
+          "bytes": 328
+        }
+      ]
+    }
+  ]
+}
@@ -1,14 +1,35 @@
+// Hashed icon/graphic URLs emitted by scripts/asset_pipeline.py
+importScripts('/precache-manifest.js')
+// Versioned app icon URLs emitted by scripts/generate-app-icons.py
+importScripts('/app-icons.js')
+
 const CACHE_NAME = 'peakone-ai-v1'
 const STATIC_CACHE = 'peakone-static-v1'
 const DYNAMIC_CACHE = 'peakone-dynamic-v1'
+const PRECACHE = 'peakone-precache-v1'
+
+const PRECACHE_MANIFEST = self.__PRECACHE_MANIFEST || { revision: 'none', assets: [] }
+const PRECACHE_URLS = new Set(
+  PRECACHE_MANIFEST.assets.map((asset) => new URL(asset.url, self.location.origin).href)
+)
+
+// Icons are regenerated in place; the ?v= hash keeps a cached copy from outliving them
+const APP_ICONS = self.__APP_ICONS || {}
+const appIcon = (name) => APP_ICONS[name] || `/icons/pwa/${name}`
+
+// 1x1 probes used to detect which image formats this browser can decode
+const FORMAT_PROBES = {
+  'image/webp': 'data:image/webp;base64,UklGRiIAAABXRUJQVlA4IBYAAAAwAQCdASoBAAEADsD+JaQAA3AAAAAA',
+  'image/avif': 'data:image/avif;base64,AAAAIGZ0eXBhdmlmAAAAAGF2aWZtaWYxbWlhZk1BMUIAAAGGbWV0YQAAAAAAAAAhaGRscgAAAAAAAAAAcGljdAAAAAAAAAAAAAAAAAAAAAAOcGl0bQAAAAAAAQAAACxpbG9jAAAAAEQAAAIAAQAAAAEAAAHCAAAAIQACAAAAAQAAAa4AAAAUAAAAQmlpbmYAAAAAAAIAAAAaaW5mZQIAAAAAAQAAYXYwMUNvbG9yAAAAABppbmZlAgAAAAACAABhdjAxQWxwaGEAAAAAGmlyZWYAAAAAAAAADmF1eGwAAgABAAEAAADDaXBycAAAAJ1pcGNvAAAAFGlzcGUAAAAAAAAAAQAAAAEAAAAQcGl4aQAAAAADCAgIAAAADGF2MUOBAAwAAAAAE2NvbHJuY2x4AAEADQAGgAAAAA5waXhpAAAAAAEIAAAADGF2MUOBABwAAAAAOGF1eEMAAAAAdXJuOm1wZWc6bXBlZ0I6Y2ljcDpzeXN0ZW1zOmF1eGlsaWFyeTphbHBoYQAAAAAeaXBtYQAAAAAAAAACAAEEAQKDBAACBAEFhgcAAAA9bWRhdBIACgQYAAYVMgoYACihAAIhHctgEgAKCBgABogIaDQgMhMZR4eGIYeeeeaAAACQQMkcYUK+'
+}
 
 // Static assets to cache on install
 const STATIC_ASSETS = [
   '/',
   '/offline',
   '/manifest.json',
-  '/icons/pwa/icon-192.png',
-  '/icons/pwa/icon-512.png'
+  appIcon('icon-192.png'),
+  appIcon('icon-512.png')
 ]
 
 // Routes that should work offline
@@ -29,6 +50,7 @@ self.addEventListener('install', (event) => {
         console.log('[SW] Caching static assets')
         return cache.addAll(STATIC_ASSETS)
       })
+      .then(() => precacheAssets())
       .then(() => self.skipWaiting())
   )
 })
@@ -41,17 +63,110 @@ self.addEventListener('activate', (event) => {
       .then((cacheNames) => {
         return Promise.all(
           cacheNames
-            .filter((name) => name !== STATIC_CACHE && name !== DYNAMIC_CACHE)
+            .filter((name) => name !== STATIC_CACHE && name !== DYNAMIC_CACHE && name !== PRECACHE)
             .map((name) => {
               console.log('[SW] Deleting old cache:', name)
               return caches.delete(name)
             })
         )
       })
+      .then(() => evictStalePrecache())
+      .then(() => evictStaleAppIcons())
       .then(() => self.clients.claim())
   )
 })
 
+async function supportsImageType(type) {
+  const probe = FORMAT_PROBES[type]
+  if (!probe) {
+    return true
+  }
+  if (typeof createImageBitmap !== 'function') {
+    return false
+  }
+  try {
+    const blob = await fetch(probe).then((response) => response.blob())
+    await createImageBitmap(blob)
+    return true
+  } catch {
+    return false
+  }
+}
+
+// Store the smallest decodable variant of each manifest asset under the URL the
+// app requests. Entries already cached at their revision are skipped, so an
+// update only downloads assets whose bytes changed. A failed asset is left to
+// the fetch handler rather than failing the install.
+async function precacheAssets() {
+  const cache = await caches.open(PRECACHE)
+  const types = new Set(
+    PRECACHE_MANIFEST.assets.flatMap((asset) => asset.variants.map((variant) => variant.type))
+  )
+  const supported = new Set()
+  for (const type of types) {
+    if (await supportsImageType(type)) {
+      supported.add(type)
+    }
+  }
+
+  console.log('[SW] Precaching assets, revision', PRECACHE_MANIFEST.revision)
+  const results = await Promise.allSettled(
+    PRECACHE_MANIFEST.assets.map(async (asset) => {
+      if (await cache.match(asset.url)) {
+        return
+      }
+      // Variants are listed smallest first
+      const variant = asset.variants.find((v) => supported.has(v.type)) || asset.variants[asset.variants.length - 1]
+      const response = await fetch(variant.url)
+      if (!response.ok) {
+        throw new Error(`${variant.url}: HTTP ${response.status}`)
+      }
+      await cache.put(asset.url, response)
+    })
+  )
+  for (const result of results) {
+    if (result.status === 'rejected') {
+      console.warn('[SW] Precache failed:', result.reason)
+    }
+  }
+}
+
+// Map a request to the precache entry it loads: the asset URL itself, or the
+// one next/image was asked to optimize (/_next/image?url=<asset url>&w=...)
+function precacheKey(url) {
+  const target = url.pathname === '/_next/image'
+    ? new URL(url.searchParams.get('url') || '/', self.location.origin)
+    : url
+  const key = target.origin + target.pathname
+  return PRECACHE_URLS.has(key) ? key : null
+}
+
+// Drop precached URLs that are no longer in the current manifest
+async function evictStalePrecache() {
+  const cache = await caches.open(PRECACHE)
+  const requests = await cache.keys()
+  await Promise.all(
+    requests
+      .filter((request) => !PRECACHE_URLS.has(request.url))
+      .map((request) => {
+        console.log('[SW] Evicting stale asset:', request.url)
+        return cache.delete(request)
+      })
+  )
+}
+
+// Drop cached app icons from earlier versions (older ?v= or none at all)
+async function evictStaleAppIcons() {
+  const current = new Set(STATIC_ASSETS.map((url) => new URL(url, self.location.origin).href))
+  const cache = await caches.open(STATIC_CACHE)
+  const requests = await cache.keys()
+  await Promise.all(
+    requests
+      .filter((request) => new URL(request.url).pathname.startsWith('/icons/pwa/') && !current.has(request.url))
+      .map((request) => cache.delete(request))
+  )
+}
+
 // Fetch event - network first with cache fallback
 self.addEventListener('fetch', (event) => {
   const { request } = event
@@ -67,6 +182,17 @@ self.addEventListener('fetch', (event) => {
     return
   }
 
+  // Handle precached generated assets - cache first, by manifest entry
+  const precached = precacheKey(url)
+  if (precached) {
+    event.respondWith(
+      caches.open(PRECACHE)
+        .then((cache) => cache.match(precached))
+        .then((cached) => cached || fetch(request))
+    )
+    return
+  }
+
   // Handle API requests - network only
   if (url.pathname.startsWith('/api/')) {
     event.respondWith(
@@ -188,7 +314,7 @@ self.addEventListener('push', (event) => {
   let data = {
     title: 'Peak One',
     body: 'You have a new notification',
-    icon: '/icons/pwa/icon-192.png',
+    icon: appIcon('icon-192.png'),
     badge: '/icons/pwa/badge-72.png'
   }
 
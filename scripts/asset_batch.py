@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Batch submission for the Peak AI asset generators
+Serializes jobs into a JSONL request file for the OpenAI Batch API, tracks
+submitted batches on disk so collection can resume, and provides a local
+stand-in endpoint that renders placeholders for testing
+"""
+
+import base64
+import hashlib
+import io
+import json
+import os
+import time
+
+import numpy as np
+import requests
+from PIL import Image
+
+from asset_pipeline import CACHE_DIR
+
+BATCH_DIR = CACHE_DIR / "batches"
+
+BATCH_ENDPOINT = "/v1/images/generations"
+COMPLETION_WINDOW = "24h"
+
+# Batch requests are billed at half the interactive price
+BATCH_DISCOUNT = 0.5
+
+# Poll delay starts here and grows by POLL_BACKOFF up to POLL_MAX_SECONDS
+POLL_INITIAL_SECONDS = 5
+POLL_MAX_SECONDS = 300
+POLL_BACKOFF = 1.5
+
+TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+# Local stand-in: simulated time per request
+LOCAL_SECONDS_PER_REQUEST = 0.5
+# Placeholder renders from the local stand-in land here, never in assets/ or public/
+LOCAL_OUTPUT_DIR = BATCH_DIR / "local" / "out"
+
+
+def request_line(job):
+    """One Batch API request for a job; custom_id is the job's logical URL"""
+    body = {
+        "model": job["model"],
+        "prompt": job["prompt"],
+        "n": 1,
+        "size": job["size"],
+        "quality": job["quality"],
+    }
+    # gpt-image-1 always returns base64; DALL-E defaults to a short-lived URL
+    if job["model"].startswith("dall-e"):
+        body["response_format"] = "b64_json"
+    return {"custom_id": job["url"], "method": "POST", "url": BATCH_ENDPOINT, "body": body}
+
+
+def write_job_file(jobs, path):
+    os.makedirs(path.parent, exist_ok=True)
+    with open(path, "w") as f:
+        for job in jobs:
+            f.write(json.dumps(request_line(job)) + "\n")
+    return path
+
+
+def result_image(result):
+    """
+    Image bytes from one line of a batch output file
+
+    Returns:
+        (bytes, None) on success, (None, error message) otherwise
+    """
+    if result.get("error"):
+        return None, result["error"].get("message", str(result["error"]))
+    response = result.get("response") or {}
+    if response.get("status_code") != 200:
+        return None, f"HTTP {response.get('status_code')}: {json.dumps(response.get('body'))[:200]}"
+    data = (response.get("body") or {}).get("data") or []
+    if not data or "b64_json" not in data[0]:
+        return None, "no b64_json in response"
+    return base64.b64decode(data[0]["b64_json"]), None
+
+
+def poll_delays():
+    delay = POLL_INITIAL_SECONDS
+    while True:
+        yield delay
+        delay = min(POLL_MAX_SECONDS, delay * POLL_BACKOFF)
+
+
+class BatchState:
+    """
+    A submitted batch, persisted as .asset-cache/batches/<batch id>.json
+
+    Holds what collection needs after the submitting process has gone: the
+    endpoint, the submitted jobs by custom_id and any near-duplicate reuses
+    waiting on renders from the batch.
+    """
+
+    def __init__(self, batch_id, endpoint, jobs, reuses):
+        self.batch_id = batch_id
+        self.endpoint = endpoint
+        self.jobs = jobs
+        self.reuses = reuses
+
+    @property
+    def path(self):
+        return BATCH_DIR / f"{self.batch_id}.json"
+
+    @classmethod
+    def load(cls, batch_id):
+        with open(BATCH_DIR / f"{batch_id}.json") as f:
+            data = json.load(f)
+        return cls(batch_id, data["endpoint"], data["jobs"], data["reuses"])
+
+    def save(self):
+        os.makedirs(BATCH_DIR, exist_ok=True)
+        with open(self.path, "w") as f:
+            json.dump({"endpoint": self.endpoint, "jobs": self.jobs, "reuses": self.reuses}, f, indent=2)
+
+    def delete(self):
+        if self.path.exists():
+            self.path.unlink()
+
+
+class OpenAIBatchClient:
+    """Files + Batches API calls for one image batch"""
+
+    def __init__(self, api_key=None):
+        api_key = api_key or os.environ.get("OPENAI_API_KEY")
+        if not api_key:
+            raise ValueError("OpenAI API key required. Set OPENAI_API_KEY environment variable or pass api_key parameter.")
+        self.base_url = "https://api.openai.com/v1"
+        self.session = requests.Session()
+        self.session.headers["Authorization"] = f"Bearer {api_key}"
+
+    def upload(self, path):
+        with open(path, "rb") as f:
+            response = self.session.post(f"{self.base_url}/files", data={"purpose": "batch"},
+                                         files={"file": (path.name, f)}, timeout=120)
+        response.raise_for_status()
+        return response.json()["id"]
+
+    def create(self, input_file_id):
+        response = self.session.post(f"{self.base_url}/batches", json={
+            "input_file_id": input_file_id,
+            "endpoint": BATCH_ENDPOINT,
+            "completion_window": COMPLETION_WINDOW,
+        }, timeout=60)
+        response.raise_for_status()
+        return response.json()
+
+    def retrieve(self, batch_id):
+        response = self.session.get(f"{self.base_url}/batches/{batch_id}", timeout=60)
+        response.raise_for_status()
+        return response.json()
+
+    def results(self, file_id):
+        """Yield output (or error) file lines as they stream in"""
+        with self.session.get(f"{self.base_url}/files/{file_id}/content", stream=True, timeout=300) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if line:
+                    yield json.loads(line)
+
+
+class LocalBatchClient:
+    """
+    Offline stand-in for OpenAIBatchClient
+
+    Accepts the same JSONL file and reports progress at LOCAL_SECONDS_PER_REQUEST
+    per request since creation, so it survives across processes like a real
+    batch. Results are placeholder gradients at the requested size; they are
+    collected into LOCAL_OUTPUT_DIR and never published.
+    """
+
+    def __init__(self, root=BATCH_DIR / "local"):
+        self.root = root
+
+    def upload(self, path):
+        os.makedirs(self.root, exist_ok=True)
+        with open(path, "rb") as f:
+            data = f.read()
+        file_id = f"file-local-{hashlib.sha256(data).hexdigest()[:16]}"
+        with open(self.root / f"{file_id}.jsonl", "wb") as f:
+            f.write(data)
+        return file_id
+
+    def create(self, input_file_id):
+        batch = {
+            "id": f"batch-local-{int(time.time() * 1000)}",
+            "input_file_id": input_file_id,
+            "created_at": time.time(),
+        }
+        with open(self.root / f"{batch['id']}.json", "w") as f:
+            json.dump(batch, f)
+        return self.retrieve(batch["id"])
+
+    def retrieve(self, batch_id):
+        with open(self.root / f"{batch_id}.json") as f:
+            batch = json.load(f)
+        total = len(self._requests(batch["input_file_id"]))
+        done = min(total, int((time.time() - batch["created_at"]) / LOCAL_SECONDS_PER_REQUEST))
+        completed = done == total
+        return {
+            "id": batch_id,
+            "status": "completed" if completed else "in_progress",
+            "request_counts": {"total": total, "completed": done, "failed": 0},
+            "output_file_id": f"{batch['input_file_id']}-output" if completed else None,
+            "error_file_id": None,
+        }
+
+    def results(self, file_id):
+        for request in self._requests(file_id.removesuffix("-output")):
+            width, height = (int(n) for n in request["body"]["size"].split("x"))
+            buffer = io.BytesIO()
+            self._placeholder(request["body"]["prompt"], width, height).save(buffer, "PNG")
+            yield {
+                "custom_id": request["custom_id"],
+                "response": {
+                    "status_code": 200,
+                    "body": {"data": [{"b64_json": base64.b64encode(buffer.getvalue()).decode()}]},
+                },
+                "error": None,
+            }
+
+    def _requests(self, file_id):
+        with open(self.root / f"{file_id}.jsonl") as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    @staticmethod
+    def _placeholder(prompt, width, height):
+        """Brand-gradient disc on transparency, offset by the prompt hash"""
+        seed = int.from_bytes(hashlib.sha256(prompt.encode()).digest()[:4], "big")
+        y, x = np.mgrid[0:height, 0:width].astype(np.float32)
+        cx = width * (0.4 + (seed % 100) / 500)
+        cy = height * (0.4 + (seed // 100 % 100) / 500)
+        radius = min(width, height) * 0.35
+        coverage = np.clip(radius - np.sqrt((x - cx) ** 2 + (y - cy) ** 2), 0, 1)
+        t = ((x / width + y / height) / 2)[..., None]
+        rgb = np.array([59, 130, 246], np.float32) * (1 - t) + np.array([139, 92, 246], np.float32) * t
+        pixels = np.dstack([rgb, coverage * 255]).astype(np.uint8)
+        return Image.fromarray(pixels, "RGBA")
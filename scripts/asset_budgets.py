@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Performance budgets for the Peak AI generated assets
+Checks every served variant, theme variants included, against its category's
+pixel and byte limits and each page surface's total bytes per format. Traced
+SVGs are optional: one is only published when it passes the fidelity check
+"""
+
+import os
+
+from PIL import Image
+
+from asset_pipeline import public_path
+
+
+def asset_budget(group, config):
+    """
+    Resolve one asset's budget from its group
+
+    Groups declare {"category", "rendered_px", "max_density", "max_bytes": {ext: bytes}};
+    an asset may override "rendered_px" when it is shown at a different size.
+    """
+    budget = dict(group["budget"])
+    if "rendered_px" in config:
+        budget["rendered_px"] = config["rendered_px"]
+    return budget
+
+
+def check_budgets(jobs, asset_map, surface_budgets=None):
+    """
+    Compare the published variants of each job with its budget
+
+    Args:
+        jobs: Jobs from build_jobs(), carrying "budget", "surface" and "themes"
+        surface_budgets: {surface: {ext: max total bytes}} for a page surface
+
+    Returns:
+        (rows, surface totals {surface: {ext: bytes}}, violations)
+        rows are (job, {ext: (width, height, bytes)} of the base theme, [problems])
+    """
+    rows = []
+    totals = {}
+    violations = []
+
+    for job in jobs:
+        budget = job["budget"]
+        max_px = budget["rendered_px"] * budget["max_density"]
+        stem = os.path.splitext(job["url"])[0]
+        variants = {}
+        problems = []
+
+        # Theme variants get the same per-file limits; a page loads one theme,
+        # so only the base set counts towards its surface
+        for theme in [None, *job["themes"]]:
+            prefix = f"{theme} " if theme else ""
+            theme_stem = f"{stem}.{theme}" if theme else stem
+            for ext, max_bytes in budget["max_bytes"].items():
+                entry = asset_map.get(theme_stem + ext)
+                if not entry or not public_path(entry["url"]).exists():
+                    # The app falls back to the raster when no SVG was kept
+                    if ext != ".svg":
+                        problems.append(f"{prefix}{ext} variant is not published")
+                    continue
+                if ext == ".svg":
+                    # Vector: no pixel size to check
+                    width = height = None
+                else:
+                    # Image.open() only parses the header
+                    with Image.open(public_path(entry["url"])) as image:
+                        width, height = image.size
+
+                if width and max(width, height) > max_px:
+                    problems.append(f"{prefix}{ext} is {width}x{height} px, over {max_px} px "
+                                    f"({budget['rendered_px']} px rendered x{budget['max_density']})")
+                if entry["bytes"] > max_bytes:
+                    problems.append(f"{prefix}{ext} is {entry['bytes'] / 1024:.1f} KB, "
+                                    f"over {max_bytes / 1024:.1f} KB")
+
+                if theme is None:
+                    variants[ext] = (width, height, entry["bytes"])
+                    surface = totals.setdefault(job["surface"], {})
+                    surface[ext] = surface.get(ext, 0) + entry["bytes"]
+
+        rows.append((job, variants, problems))
+        violations += [f"{job['url']}: {problem}" for problem in problems]
+
+    for surface, limits in (surface_budgets or {}).items():
+        for ext, max_bytes in limits.items():
+            total = totals.get(surface, {}).get(ext, 0)
+            if total > max_bytes:
+                violations.append(f"surface {surface}: {ext} total {total / 1024:.1f} KB, "
+                                  f"over {max_bytes / 1024:.1f} KB")
+
+    return rows, totals, violations
+
+
+def report_budgets(jobs, asset_map, surface_budgets=None):
+    """Print the budget report; returns the list of violations"""
+    rows, totals, violations = check_budgets(jobs, asset_map, surface_budgets)
+
+    print("\n📏 ASSET BUDGETS")
+    print("-" * 80)
+    for job, variants, problems in rows:
+        status = "❌" if problems else "✓"
+        sizes = "  ".join(
+            f"{ext[1:]} {bytes_ / 1024:>5.1f} KB" for ext, (_, _, bytes_) in variants.items()
+        )
+        dims = max((f"{w}x{h}" for w, h, _ in variants.values() if w), default="-")
+        themes = "".join(f"  +{theme}" for theme in job["themes"])
+        print(f"   {status} {job['key']:<24} {job['budget']['category']:<12} {dims:>9}  {sizes}{themes}")
+        for problem in problems:
+            print(f"      ↳ {problem}")
+
+    for surface, limits in (surface_budgets or {}).items():
+        used = totals.get(surface, {})
+        parts = []
+        for ext, max_bytes in limits.items():
+            mark = "❌" if used.get(ext, 0) > max_bytes else "✓"
+            parts.append(f"{mark} {ext[1:]} {used.get(ext, 0) / 1024:.0f}/{max_bytes / 1024:.0f} KB")
+        print(f"   📄 {surface:<24} {'  '.join(parts)}")
+
+    return violations
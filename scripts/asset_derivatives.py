@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Served derivatives of full-resolution masters
+Each master is written to public/ as PNG, WebP and AVIF at the largest pixel
+size its budget allows, so the 1024x1024 API output never ships as-is, plus a
+traced SVG and symbol sprite for flat icons that pass the fidelity check.
+Theme variants (nav-home-24.dark.png) are recolored locally from the same master
+"""
+
+import os
+import re
+
+import numpy as np
+from PIL import Image
+
+import image_kernels
+import vector_trace
+from asset_pipeline import master_path, public_path, public_url
+from asset_profiling import stage
+
+# The PNG keeps the logical URL the app requests; the service worker swaps in
+# the smallest variant the browser decodes
+DERIVED_FORMATS = {".png": "PNG", ".webp": "WEBP", ".avif": "AVIF"}
+
+# Every variant a master can have; ones a derive pass didn't write are unpublished
+VARIANT_EXTENSIONS = (*DERIVED_FORMATS, ".svg")
+
+# Fill colors and gradient ids in vector_trace.vectorize() output
+_SVG_COLOR = re.compile(r"#[0-9a-f]{6}\b")
+_SVG_ID = re.compile(r'(?<=id=")[\w-]+(?=-fill")|(?<=url\(#)[\w-]+(?=-fill\))')
+
+
+def derived_size(budget, master_side):
+    """Rendered size x max density, never upscaling the master"""
+    return min(budget["rendered_px"] * budget["max_density"], master_side)
+
+
+def load_master(logical_url):
+    """Decode a master as the square, alpha-cleaned image every variant starts from"""
+    with open(master_path(logical_url), "rb") as f:
+        image = image_kernels.decode(f.read())
+    return image_kernels.clean_alpha(image_kernels.fit_square(image))
+
+
+def themed_svg(svg, theme, params):
+    """Recolor a traced SVG's fills like recolor() does its raster, renaming its ids"""
+    colors = sorted(set(_SVG_COLOR.findall(svg)))
+    if not colors:
+        return svg
+    swatch = np.array([[[*bytes.fromhex(color[1:]), 255] for color in colors]], dtype=np.uint8)
+    recolored = np.asarray(image_kernels.recolor(Image.fromarray(swatch, "RGBA"), **params))[0]
+    lookup = {color: "#" + bytes(rgba[:3]).hex() for color, rgba in zip(colors, recolored)}
+    svg = _SVG_COLOR.sub(lambda match: lookup[match.group()], svg)
+    return _SVG_ID.sub(lambda match: f"{match.group()}-{theme}", svg)
+
+
+def derive(logical_url, budget, vectorize=False, themes=None):
+    """
+    Write the served variants of one master next to its logical URL
+
+    Args:
+        vectorize: Also trace an SVG, kept only if it passes the fidelity check
+        themes: {theme: recolor() parameters}; each theme gets the same set of
+            files under {stem}.{theme}{ext}
+
+    Returns:
+        Paths written under public/, ready for publish_derivatives()
+    """
+    # One parent stage, so --profile-allocations snapshots once per master
+    with stage("derive"):
+        image = load_master(logical_url)
+        side = derived_size(budget, image.width)
+        scaled = image_kernels.downscale(image, [side])[side]
+
+        stem = os.path.splitext(logical_url)[0]
+        outputs = [(stem + ext, image_kernels.encode(scaled, fmt)) for ext, fmt in DERIVED_FORMATS.items()]
+
+        svg = None
+        if vectorize:
+            svg, fidelity = vector_trace.vectorize(image, os.path.basename(stem), check_px=side)
+            if fidelity["passed"]:
+                outputs.append((stem + ".svg", svg.encode()))
+            else:
+                svg = None
+                print(f"   ⚠️  {logical_url}: trace kept raster-only (coverage error "
+                      f"{fidelity['coverage_error']:.1%}, color error {fidelity['color_error']:.0f})")
+
+        for theme, params in (themes or {}).items():
+            # Recoloring the served size, not the master, keeps this in the milliseconds
+            themed = image_kernels.recolor(scaled, **params)
+            outputs += [(f"{stem}.{theme}{ext}", image_kernels.encode(themed, fmt))
+                        for ext, fmt in DERIVED_FORMATS.items()]
+            if svg:
+                outputs.append((f"{stem}.{theme}.svg", themed_svg(svg, theme, params).encode()))
+
+        paths = []
+        for url, data in outputs:
+            path = public_path(url)
+            os.makedirs(path.parent, exist_ok=True)
+            with stage("write"):
+                with open(path, "wb") as f:
+                    f.write(data)
+            paths.append(path)
+        return paths
+
+
+def variant_urls(logical_url, asset_map):
+    """Every published variant of a master: its formats and their themed versions"""
+    stem = os.path.splitext(logical_url)[0]
+    return [url for url in asset_map.assets
+            if url.startswith(stem + ".") and os.path.splitext(url)[1] in VARIANT_EXTENSIONS]
+
+
+def publish_derivatives(logical_url, paths, asset_map, surface=None):
+    """Fingerprint a master's variants and drop any it no longer has"""
+    written = {public_url(path) for path in paths}
+    with stage("publish"):
+        for path in paths:
+            asset_map.publish(path, surface=surface)
+        for url in variant_urls(logical_url, asset_map):
+            if url not in written:
+                asset_map.unpublish(url)
+
+
+def publish_sprites(jobs, asset_map):
+    """
+    Rebuild each group's <symbol> sprite from its published SVGs
+
+    Symbols are named after the asset (nav-home-24), so markup can use
+    <svg><use href="{sprite url}#nav-home-24"/></svg>. Each theme gets its own
+    sprite (nav-sprite.dark.svg) with the same symbol ids.
+    """
+    sprites = {}
+    for job in jobs:
+        if job["sprite"]:
+            sprite_stem = os.path.splitext(job["sprite"])[0]
+            for suffix in ["", *(f".{theme}" for theme in job["themes"])]:
+                sprites.setdefault(sprite_stem + suffix + ".svg", []).append((job, suffix))
+
+    # Sprites of themes no longer defined
+    for sprite_url in {job["sprite"] for job in jobs if job["sprite"]}:
+        for url in variant_urls(sprite_url, asset_map):
+            if url not in sprites:
+                asset_map.unpublish(url)
+
+    for sprite_url, members in sprites.items():
+        svgs = {}
+        for job, suffix in members:
+            stem = os.path.splitext(job["url"])[0]
+            source = asset_map.resolve(stem + suffix + ".svg")
+            if source:
+                svgs[os.path.basename(stem)] = source.read_text()
+        if not svgs:
+            asset_map.unpublish(sprite_url)
+            continue
+        path = public_path(sprite_url)
+        with stage("write"):
+            path.write_text(vector_trace.symbol_sprite(svgs))
+        with stage("publish"):
+            asset_map.publish(path)
+        print(f"🧩 Sprite: {sprite_url} ({len(svgs)} symbols)")
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Local latency/payload history for image generation requests
+Predicts per-job duration and spend, and plans batch order and wall time
+"""
+
+import heapq
+import json
+import os
+import statistics
+import threading
+import time
+
+from asset_pipeline import CACHE_DIR
+
+HISTORY_PATH = CACHE_DIR / "history.json"
+
+# Samples kept per (model, size, quality)
+MAX_SAMPLES = 50
+
+# Used until a (model, size, quality) has history of its own
+DEFAULT_LATENCY_SECONDS = 30.0
+DEFAULT_PAYLOAD_BYTES = 1_500_000
+
+# Request timeout floor, and headroom over the slowest recorded sample
+MIN_TIMEOUT_SECONDS = 60
+TIMEOUT_HEADROOM = 2.0
+
+# USD per image, from the OpenAI pricing page
+PRICES = {
+    ("gpt-image-1", "1024x1024", "low"): 0.011,
+    ("gpt-image-1", "1024x1024", "medium"): 0.042,
+    ("gpt-image-1", "1024x1024", "high"): 0.167,
+    ("gpt-image-1", "1536x1024", "high"): 0.25,
+    ("gpt-image-1", "1024x1536", "high"): 0.25,
+    ("dall-e-3", "1024x1024", "standard"): 0.04,
+    ("dall-e-3", "1024x1024", "hd"): 0.08,
+    ("dall-e-3", "1792x1024", "hd"): 0.12,
+    ("dall-e-3", "1024x1792", "hd"): 0.12,
+}
+
+
+def history_key(model, size, quality):
+    return f"{model}|{size}|{quality}"
+
+
+def job_key(job):
+    return history_key(job["model"], job["size"], job["quality"])
+
+
+class LatencyHistory:
+    """
+    Rolling latency and payload-size samples per (model, size, quality)
+
+    Stored as .asset-cache/history.json so estimates improve with every run.
+    record() is safe to call from generator worker threads.
+    """
+
+    def __init__(self, path=HISTORY_PATH):
+        self.path = path
+        self.samples = {}
+        self._lock = threading.Lock()
+        if self.path.exists():
+            with open(self.path) as f:
+                self.samples = json.load(f)
+
+    def record(self, model, size, quality, seconds, payload_bytes):
+        key = history_key(model, size, quality)
+        with self._lock:
+            samples = self.samples.setdefault(key, [])
+            samples.append({
+                "seconds": round(seconds, 3),
+                "bytes": payload_bytes,
+                "at": int(time.time()),
+            })
+            del samples[:-MAX_SAMPLES]
+
+    def save(self):
+        os.makedirs(self.path.parent, exist_ok=True)
+        with self._lock:
+            with open(self.path, "w") as f:
+                json.dump(self.samples, f, indent=2)
+
+    def predict_seconds(self, job):
+        samples = self.samples.get(job_key(job))
+        if not samples:
+            return DEFAULT_LATENCY_SECONDS
+        return statistics.median(s["seconds"] for s in samples)
+
+    def predict_bytes(self, job):
+        samples = self.samples.get(job_key(job))
+        if not samples:
+            return DEFAULT_PAYLOAD_BYTES
+        return statistics.median(s["bytes"] for s in samples)
+
+    def timeout_for(self, job):
+        """Request timeout that leaves headroom over the slowest observed render"""
+        samples = self.samples.get(job_key(job))
+        if not samples:
+            return MIN_TIMEOUT_SECONDS
+        return max(MIN_TIMEOUT_SECONDS, TIMEOUT_HEADROOM * max(s["seconds"] for s in samples))
+
+    def sample_count(self, job):
+        return len(self.samples.get(job_key(job), []))
+
+    def order(self, jobs):
+        """Longest predicted job first, so the tail of the batch isn't one slow render"""
+        return sorted(jobs, key=self.predict_seconds, reverse=True)
+
+    def estimate(self, jobs, concurrency=1, dispatch_interval=0.0):
+        """
+        Predict wall time and spend for a batch
+
+        Simulates longest-first dispatch onto `concurrency` workers, with consecutive
+        dispatches spaced by at least `dispatch_interval` seconds.
+
+        Returns:
+            dict with wall_seconds, serial_seconds, cost, bytes and unpriced job keys
+        """
+        workers = [0.0] * max(1, concurrency)
+        heapq.heapify(workers)
+        wall = 0.0
+        serial = 0.0
+
+        for index, job in enumerate(self.order(jobs)):
+            seconds = self.predict_seconds(job)
+            start = max(heapq.heappop(workers), index * dispatch_interval)
+            heapq.heappush(workers, start + seconds)
+            wall = max(wall, start + seconds)
+            serial += seconds
+
+        unpriced = sorted({job_key(job) for job in jobs
+                           if (job["model"], job["size"], job["quality"]) not in PRICES})
+        return {
+            "wall_seconds": wall,
+            "serial_seconds": serial,
+            "cost": sum(PRICES.get((job["model"], job["size"], job["quality"]), 0.0) for job in jobs),
+            "bytes": sum(self.predict_bytes(job) for job in jobs),
+            "unpriced": unpriced,
+        }
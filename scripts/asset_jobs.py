@@ -0,0 +1,649 @@
+#!/usr/bin/env python3
+"""
+Batch runner shared by the Peak AI asset generators
+Turns asset definitions into jobs, schedules them longest-first across a worker
+pool, derives the served files from each master, checks them against their
+budgets and prints dry-run time/cost estimates from the local latency history.
+--watch keeps everything warm and re-renders definitions as they are edited;
+--batch submits the whole set through the Batch API instead
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+
+from pathlib import Path
+
+import requests
+
+from asset_batch import (
+    BATCH_DIR, BATCH_DISCOUNT, COMPLETION_WINDOW, LOCAL_OUTPUT_DIR, TERMINAL_STATUSES,
+    BatchState, LocalBatchClient, OpenAIBatchClient, poll_delays, result_image, write_job_file,
+)
+from asset_budgets import asset_budget, report_budgets
+from asset_derivatives import derive, publish_derivatives, publish_sprites
+from asset_history import LatencyHistory, PRICES, job_key
+from asset_pipeline import ROOT_DIR, AssetMap, master_path, public_url
+from asset_profiling import profile_run, stage
+from asset_watch import DefinitionWatcher, diff_jobs
+from gpt_image import GPTImageGenerator
+from prompt_similarity import PromptIndex
+
+# Minimum spacing between API dispatches
+RATE_LIMIT_SECONDS = 2
+
+
+def build_jobs(groups, model, size="1024x1024", quality="high", themes=None):
+    """
+    Flatten asset groups into generation jobs
+
+    Args:
+        groups: [{"title": ..., "surface": ..., "budget": {...},
+                  "assets": {key: {"prompt": ..., "path": ...}}}]
+            "path" is the logical file under public/; the render itself is kept
+            under assets/masters/. Individual assets may override "size",
+            "quality" and "rendered_px". Groups of flat icons may set
+            "vectorize": True and a "sprite" path for their <symbol> sprite.
+            "themes" lists the color variants derived for every asset in a group.
+        model, size, quality: Defaults for every asset in the script
+        themes: {theme: image_kernels.recolor() parameters} for the whole script
+
+    Returns:
+        List of job dicts
+    """
+    jobs = []
+    for group in groups:
+        for key, config in group["assets"].items():
+            url = public_url(config["path"])
+            jobs.append({
+                "key": key,
+                "url": url,
+                "group": group["title"],
+                "surface": group["surface"],
+                "budget": asset_budget(group, config),
+                "vectorize": group.get("vectorize", False),
+                "sprite": public_url(group["sprite"]) if group.get("sprite") else None,
+                "themes": {name: themes[name] for name in group.get("themes", [])},
+                "prompt": config["prompt"],
+                "path": master_path(url),
+                "model": model,
+                "size": config.get("size", size),
+                "quality": config.get("quality", quality),
+            })
+    return jobs
+
+
+def parse_args(description):
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Predict wall time and spend from local history without calling the API")
+    parser.add_argument("--concurrency", type=int, default=1,
+                        help="Number of renders in flight at once (default: 1)")
+    parser.add_argument("--near-duplicates", choices=["ask", "reuse", "render"], default="ask",
+                        help="What to do when a prompt nearly matches an existing render (default: ask)")
+    parser.add_argument("--profile", action="store_true",
+                        help="Write a CPU flamegraph profile with per-stage time and peak memory")
+    parser.add_argument("--profile-allocations", action="store_true",
+                        help="With --profile, also record top allocation sites per stage (slow)")
+    parser.add_argument("--from-masters", action="store_true",
+                        help="Re-derive served files from the existing masters without calling the API")
+    parser.add_argument("--check-budgets", action="store_true",
+                        help="Only check the published files against their budgets")
+    parser.add_argument("--watch", action="store_true",
+                        help="Keep running and re-render each definition as it is edited in this script")
+    parser.add_argument("--batch", action="store_true",
+                        help=f"Submit all renders as one Batch API job (half price, done within {COMPLETION_WINDOW})")
+    parser.add_argument("--batch-endpoint", choices=["openai", "local"], default="openai",
+                        help="Where --batch submits; 'local' renders placeholders offline for testing, "
+                             "into .asset-cache/batches/local/out/ without publishing them")
+    parser.add_argument("--collect", metavar="BATCH_ID",
+                        help="Resume polling and collecting a previously submitted batch")
+    return parser.parse_args()
+
+
+class DispatchThrottle:
+    """Spaces consecutive API dispatches across worker threads"""
+
+    def __init__(self, interval):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            delay = max(0.0, self._next - now)
+            self._next = max(now, self._next) + self.interval
+        if delay:
+            time.sleep(delay)
+
+
+def plan_reuse(jobs, prompt_index, mode):
+    """
+    Split jobs into renders and reuses of near-duplicate prompts
+
+    A job can reuse another job in this batch, or an earlier render of an asset this
+    batch isn't regenerating (from the prompt index, if its master is still on disk),
+    as long as model and size match.
+
+    Args:
+        mode: "reuse" accepts every match, "render" ignores them, "ask" confirms
+            each match on an interactive terminal and renders otherwise
+
+    Returns:
+        (jobs to render, {job key: (job, source url, similarity)})
+    """
+    batch_index = PromptIndex()
+    batch_urls = {job["url"] for job in jobs}
+    to_render = []
+    reuses = {}
+
+    for job in jobs:
+        matches = [
+            (url, similarity)
+            for index, published in ((batch_index, False), (prompt_index, True))
+            for url, similarity in index.query(job["prompt"], exclude=job["url"])
+            if index.entries[url]["model"] == job["model"]
+            and index.entries[url]["size"] == job["size"]
+            and (not published or (url not in batch_urls and master_path(url).exists()))
+        ]
+
+        if matches and mode != "render":
+            url, similarity = max(matches, key=lambda match: match[1])
+            print(f"♻️  {job['key']} is {similarity:.0%} similar to {url}")
+            if mode == "reuse" or confirm("   Reuse that render instead of calling the API? [Y/n] "):
+                reuses[job["key"]] = (job, url, similarity)
+                continue
+
+        to_render.append(job)
+        batch_index.add(job["url"], job["prompt"], model=job["model"], size=job["size"])
+
+    return to_render, reuses
+
+
+def confirm(question):
+    if not sys.stdin.isatty():
+        print("   Not a terminal - rendering (pass --near-duplicates reuse to reuse)")
+        return False
+    return input(question).strip().lower() in ("", "y", "yes")
+
+
+def apply_reuses(reuses, asset_map, prompt_index):
+    """Copy each source master into place for its near-duplicate jobs"""
+    successful = []
+    failed = []
+    for key, (job, source_url, similarity) in reuses.items():
+        source = master_path(source_url)
+        if not source.exists():
+            print(f"   ✗ {key}: source {source_url} was not rendered")
+            failed.append(key)
+            continue
+        try:
+            os.makedirs(os.path.dirname(job["path"]), exist_ok=True)
+            with stage("reuse"):
+                shutil.copyfile(source, job["path"])
+            publish_derivatives(job["url"], derive(job["url"], job["budget"], job["vectorize"], job["themes"]),
+                                asset_map, job["surface"])
+        except Exception as e:
+            print(f"   ✗ {key}: {e!r}")
+            failed.append(key)
+            continue
+        prompt_index.add(job["url"], job["prompt"], model=job["model"], size=job["size"])
+        print(f"   ♻️  Reused {source_url} for {key}")
+        successful.append(key)
+    return successful, failed
+
+
+def print_estimate(jobs, history, concurrency, batch=False):
+    print("🔮 DRY RUN - no API calls will be made")
+    print("-" * 80)
+
+    for job in history.order(jobs):
+        samples = history.sample_count(job)
+        basis = f"{samples} samples" if samples else "default"
+        price = PRICES.get((job["model"], job["size"], job["quality"]))
+        price_label = f"${price:.3f}" if price is not None else "unpriced"
+        print(f"   {job['key']:<28} {history.predict_seconds(job):>6.1f}s ({basis:<10}) "
+              f"{price_label:>9}  {job_key(job)}")
+
+    estimate = history.estimate(jobs, concurrency, RATE_LIMIT_SECONDS)
+    print(f"\n⏱️  Predicted wall time: {estimate['wall_seconds']:.0f}s at concurrency {concurrency} "
+          f"(serial {estimate['serial_seconds']:.0f}s)")
+    print(f"💰 Expected spend: ${estimate['cost']:.2f} for {len(jobs)} renders")
+    if batch:
+        print(f"📬 As a batch: ${estimate['cost'] * BATCH_DISCOUNT:.2f}, completed within {COMPLETION_WINDOW}")
+    print(f"💾 Expected payload: {estimate['bytes'] / 1_000_000:.1f} MB")
+    if estimate["unpriced"]:
+        print(f"⚠️  No price for: {', '.join(estimate['unpriced'])}")
+    print()
+
+
+def run_jobs(generator, jobs, asset_map, history, prompt_index, concurrency=1, on_publish=None):
+    """
+    Render jobs longest-first on a worker pool
+
+    Each successful render is timed into the history, derived into its served
+    variants on the worker and published to the asset map as soon as it completes.
+    on_publish(job), if given, runs on the calling thread after each publish.
+    A job that raises counts as failed without stopping the others, and whatever
+    was published is saved even if the run is interrupted.
+
+    Returns:
+        (successful keys, failed keys)
+    """
+    throttle = DispatchThrottle(RATE_LIMIT_SECONDS)
+
+    def render(job):
+        throttle.wait()
+        started = time.monotonic()
+        result = generator.generate(
+            job["prompt"],
+            size=job["size"],
+            quality=job["quality"],
+            output_path=str(job["path"]),
+            timeout=history.timeout_for(job)
+        )
+        if not result:
+            return None
+        history.record(job["model"], job["size"], job["quality"],
+                       time.monotonic() - started, os.path.getsize(result))
+        return derive(job["url"], job["budget"], job["vectorize"], job["themes"])
+
+    successful = []
+    failed = []
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+            futures = {pool.submit(render, job): job for job in history.order(jobs)}
+            for future in as_completed(futures):
+                job = futures[future]
+                try:
+                    paths = future.result()
+                    if paths:
+                        # Fingerprint for immutable caching
+                        publish_derivatives(job["url"], paths, asset_map, job["surface"])
+                except Exception as e:
+                    print(f"   ✗ {job['key']}: {e!r}")
+                    paths = None
+                if paths:
+                    prompt_index.add(job["url"], job["prompt"], model=job["model"], size=job["size"])
+                    successful.append(job["key"])
+                    if on_publish:
+                        on_publish(job)
+                else:
+                    failed.append(job["key"])
+    finally:
+        with stage("save"):
+            asset_map.save()
+            prompt_index.save()
+        history.save()
+    return successful, failed
+
+
+def batch_client(endpoint):
+    return LocalBatchClient() if endpoint == "local" else OpenAIBatchClient()
+
+
+def submit_batch(jobs, reuses, endpoint, history):
+    """
+    Serialize jobs into a JSONL request file and submit it as one batch
+
+    The returned state is also saved under .asset-cache/batches/ so --collect can
+    pick the batch up from another process.
+    """
+    client = batch_client(endpoint)
+    job_file = write_job_file(jobs, BATCH_DIR / f"{datetime.now():%Y%m%d-%H%M%S}-requests.jsonl")
+    with stage("submit"):
+        file_id = client.upload(job_file)
+        batch = client.create(file_id)
+
+    state = BatchState(
+        batch["id"],
+        endpoint,
+        jobs={job["url"]: {k: job[k] for k in ("key", "prompt", "model", "size", "quality")} for job in jobs},
+        reuses={key: [job["url"], url, similarity] for key, (job, url, similarity) in reuses.items()},
+    )
+    state.save()
+
+    cost = history.estimate(jobs)["cost"] * BATCH_DISCOUNT
+    print(f"📬 Submitted {len(jobs)} renders as {state.batch_id} ({endpoint}, ~${cost:.2f})")
+    print(f"   Requests: {job_file.relative_to(ROOT_DIR)}")
+    print(f"   Resume with: python {sys.argv[0]} --collect {state.batch_id}")
+    return state, client
+
+
+def collect_batch(state, client, jobs, asset_map, prompt_index, output_dir=None):
+    """
+    Poll a submitted batch with backoff, then write, derive and publish each result
+    as it streams out of the output file
+
+    Jobs come from the current definitions (for paths and budgets) with the prompt,
+    model, size and quality that were actually submitted.
+
+    Args:
+        output_dir: Write each result under here by logical URL instead of over
+            its master, without deriving or publishing it
+
+    Returns:
+        (successful keys, failed keys, near-duplicate reuses waiting on this batch)
+    """
+    last_progress = None
+    try:
+        for delay in poll_delays():
+            try:
+                batch = client.retrieve(state.batch_id)
+            except requests.RequestException as e:
+                print(f"   ⚠️  Poll failed ({e}); retrying in {delay:.0f}s")
+                time.sleep(delay)
+                continue
+            counts = batch.get("request_counts") or {}
+            progress = (batch["status"], counts.get("completed"), counts.get("failed"))
+            if progress != last_progress:
+                print(f"   ⏳ {batch['status']}: {counts.get('completed', 0)}/{counts.get('total', '?')} done, "
+                      f"{counts.get('failed', 0)} failed")
+                last_progress = progress
+            if batch["status"] in TERMINAL_STATUSES:
+                break
+            time.sleep(delay)
+    except KeyboardInterrupt:
+        print(f"\n⏸️  Stopped polling; the batch keeps running. Resume with: "
+              f"python {sys.argv[0]} --collect {state.batch_id}")
+        sys.exit(0)
+
+    for error in (batch.get("errors") or {}).get("data", []):
+        print(f"   ❌ {error.get('code')}: {error.get('message')}")
+
+    by_url = {job["url"]: job for job in jobs}
+    successful = []
+    failed = []
+    for file_id in (batch.get("output_file_id"), batch.get("error_file_id")):
+        if not file_id:
+            continue
+        for result in client.results(file_id):
+            url = result["custom_id"]
+            if url not in by_url or url not in state.jobs:
+                print(f"   ✗ {url}: no longer defined, skipped")
+                continue
+            job = {**by_url[url], **state.jobs[url]}
+            data, error = result_image(result)
+            if error:
+                print(f"   ✗ {job['key']}: {error}")
+                failed.append(job["key"])
+                continue
+
+            path = output_dir / url.lstrip("/") if output_dir else job["path"]
+            os.makedirs(path.parent, exist_ok=True)
+            with stage("write"):
+                with open(path, "wb") as f:
+                    f.write(data)
+            if output_dir:
+                print(f"   ✓ {job['key']} -> {path.relative_to(ROOT_DIR)}")
+                successful.append(job["key"])
+                continue
+            publish_derivatives(job["url"], derive(job["url"], job["budget"], job["vectorize"], job["themes"]),
+                                asset_map, job["surface"])
+            prompt_index.add(job["url"], job["prompt"], model=job["model"], size=job["size"])
+            with stage("save"):
+                asset_map.save()
+            print(f"   ✓ {job['key']}")
+            successful.append(job["key"])
+
+    # Requests with no output line at all, e.g. when the batch expired or failed validation
+    for url, submitted in state.jobs.items():
+        if submitted["key"] not in successful and submitted["key"] not in failed:
+            failed.append(submitted["key"])
+
+    reuses = {
+        key: (by_url[url], source_url, similarity)
+        for key, (url, source_url, similarity) in state.reuses.items()
+        if url in by_url
+    }
+    if batch["status"] in TERMINAL_STATUSES:
+        state.delete()
+    return successful, failed, reuses
+
+
+def rederive(jobs, asset_map):
+    """Rebuild served files from masters already on disk; a job that raises counts as failed"""
+    successful = []
+    failed = []
+    for job in jobs:
+        if not job["path"].exists():
+            print(f"   ✗ {job['key']}: no master at {job['path']}")
+            failed.append(job["key"])
+            continue
+        try:
+            publish_derivatives(job["url"], derive(job["url"], job["budget"], job["vectorize"], job["themes"]),
+                                asset_map, job["surface"])
+        except Exception as e:
+            print(f"   ✗ {job['key']}: {e!r}")
+            failed.append(job["key"])
+            continue
+        print(f"   ✓ {job['key']}")
+        successful.append(job["key"])
+    return successful, failed
+
+
+def watch_assets(args, generator, jobs, model, size, quality, asset_map, history, prompt_index,
+                 surface_budgets, themes):
+    """
+    Re-render definitions as they are edited in the running script
+
+    The API session, asset map, prompt index and latency history stay loaded
+    between edits. Only entries whose prompt, model, size or quality changed are
+    rendered; budget, theme, vectorize, sprite and surface edits re-derive from
+    the existing master. A job that fails is reported and watching continues.
+    Near-duplicate matches are only reused with --near-duplicates reuse, never
+    asked about.
+    """
+    watcher = DefinitionWatcher(sys.argv[0])
+    mode = "reuse" if args.near_duplicates == "reuse" else "render"
+
+    def save(job=None):
+        with stage("save"):
+            asset_map.save()
+            prompt_index.save()
+
+    print(f"👀 Watching {watcher.script_path.name} - save a definition to re-render it (Ctrl-C to stop)\n")
+    try:
+        while True:
+            definitions = watcher.wait()
+            if definitions is None:
+                continue
+            model = definitions.get("MODEL", model)
+            quality = definitions.get("QUALITY", quality)
+            surface_budgets = definitions.get("SURFACE_BUDGETS", surface_budgets)
+            themes = definitions.get("THEMES", themes)
+            try:
+                current = build_jobs(definitions["ASSET_GROUPS"], model, size, quality, themes)
+            except (KeyError, TypeError) as e:
+                print(f"⚠️  Invalid asset definitions: {e!r}")
+                continue
+
+            to_render, to_derive, removed = diff_jobs(jobs, current)
+            jobs = current
+            for url in removed:
+                print(f"➖ {url} no longer defined (published files left in place)")
+            if not to_render and not to_derive:
+                print(f"💤 {watcher.script_path.name} saved - no asset definitions changed")
+                continue
+
+            print("-" * 80)
+            # Failing jobs are reported by rederive/run_jobs/apply_reuses; this
+            # only catches what's left (sprites, budgets) so one bad edit can't
+            # end the session
+            try:
+                if to_derive:
+                    rederive(to_derive, asset_map)
+                    save()
+
+                generator.model = model
+                to_render, reuses = plan_reuse(to_render, prompt_index, mode)
+                run_jobs(generator, to_render, asset_map, history, prompt_index, args.concurrency, on_publish=save)
+                if reuses:
+                    apply_reuses(reuses, asset_map, prompt_index)
+                publish_sprites(jobs, asset_map)
+                save()
+
+                violations = report_budgets(jobs, asset_map, surface_budgets)
+                if violations:
+                    print(f"\n❌ {len(violations)} asset budget violation(s)")
+            except Exception as e:
+                print(f"⚠️  Applying the edit failed: {e!r}")
+            print(f"\n👀 Watching {watcher.script_path.name}\n")
+    except KeyboardInterrupt:
+        history.save()
+        print("\n👋 Stopped watching")
+
+
+def generate_assets(title, groups, model, quality, noun, output_label, size="1024x1024",
+                    surface_budgets=None, themes=None):
+    """
+    Entry point used by each generate-*.py script's main()
+
+    Exits non-zero when any published asset is over its budget.
+    """
+    args = parse_args(title.title())
+    with profile_run(args.profile, label=Path(sys.argv[0]).stem, allocations=args.profile_allocations):
+        violations = _generate_assets(args, title, groups, model, quality, noun, output_label,
+                                      size, surface_budgets, themes)
+    if violations:
+        print(f"❌ {len(violations)} asset budget violation(s) - see ASSET BUDGETS above\n")
+        sys.exit(1)
+
+
+def _generate_assets(args, title, groups, model, quality, noun, output_label, size, surface_budgets,
+                     themes):
+    jobs = build_jobs(groups, model, size, quality, themes)
+    all_jobs = jobs
+    history = LatencyHistory()
+    asset_map = AssetMap()
+    prompt_index = PromptIndex.load()
+
+    print("=" * 80)
+    print(title)
+    print("=" * 80)
+    print()
+
+    if args.check_budgets:
+        violations = report_budgets(all_jobs, asset_map, surface_budgets)
+        print()
+        return violations
+
+    if args.from_masters:
+        print("🔁 Re-deriving served files from assets/masters/")
+        print("-" * 80)
+        successful, failed = rederive(all_jobs, asset_map)
+        print(f"\n✅ Re-derived: {len(successful)} {noun}   ❌ Missing masters: {len(failed)}")
+        publish_sprites(all_jobs, asset_map)
+        with stage("save"):
+            asset_map.save()
+        violations = report_budgets(all_jobs, asset_map, surface_budgets)
+        print()
+        return violations
+
+    if args.watch:
+        watch_assets(args, GPTImageGenerator(model=model), all_jobs, model, size, quality,
+                     asset_map, history, prompt_index, surface_budgets, themes)
+        return []
+
+    if args.collect:
+        state = BatchState.load(args.collect)
+        print(f"📬 Collecting {state.batch_id} ({state.endpoint}, {len(state.jobs)} renders)")
+        print("-" * 80)
+        return _collect(title, noun, output_label, state, batch_client(state.endpoint),
+                        all_jobs, asset_map, prompt_index, surface_budgets)
+
+    # Dry runs report near-duplicates and estimate as if they were reused
+    mode = "render" if args.near_duplicates == "render" else "reuse" if args.dry_run else args.near_duplicates
+    jobs, reuses = plan_reuse(jobs, prompt_index, mode)
+    if reuses:
+        print()
+
+    if args.dry_run:
+        print_estimate(jobs, history, args.concurrency, batch=args.batch)
+        return []
+
+    for group in groups:
+        print(f"{group['title']}: {len(group['assets'])} {noun}")
+
+    if args.batch:
+        print("-" * 80)
+        state, client = submit_batch(jobs, reuses, args.batch_endpoint, history)
+        return _collect(title, noun, output_label, state, client,
+                        all_jobs, asset_map, prompt_index, surface_budgets)
+
+    generator = GPTImageGenerator(model=model)
+
+    estimate = history.estimate(jobs, args.concurrency, RATE_LIMIT_SECONDS)
+    print(f"\n⏱️  Predicted wall time: {estimate['wall_seconds']:.0f}s "
+          f"at concurrency {args.concurrency}")
+    print("-" * 80)
+
+    successful, failed = run_jobs(generator, jobs, asset_map, history, prompt_index, args.concurrency)
+    return _finish(title, noun, output_label, successful, failed, reuses,
+                   all_jobs, asset_map, prompt_index, surface_budgets)
+
+
+def _collect(title, noun, output_label, state, client, all_jobs, asset_map, prompt_index, surface_budgets):
+    """Collect a batch and finish; local placeholder batches are kept out of the published set"""
+    if state.endpoint != "local":
+        successful, failed, reuses = collect_batch(state, client, all_jobs, asset_map, prompt_index)
+        return _finish(title, noun, output_label, successful, failed, reuses,
+                       all_jobs, asset_map, prompt_index, surface_budgets)
+
+    successful, failed, reuses = collect_batch(state, client, all_jobs, asset_map, prompt_index,
+                                               output_dir=LOCAL_OUTPUT_DIR)
+    if reuses:
+        print(f"   ♻️  {len(reuses)} near-duplicate reuse(s) skipped for a local batch")
+    return _finish(title, noun, LOCAL_OUTPUT_DIR.relative_to(ROOT_DIR), successful, failed, {},
+                   all_jobs, asset_map, prompt_index, surface_budgets, publish=False)
+
+
+def _finish(title, noun, output_label, successful, failed, reuses, all_jobs, asset_map, prompt_index,
+            surface_budgets, publish=True):
+    """
+    Apply pending reuses, save, print the summary and the budget report
+
+    With publish=False only the summary is printed; nothing is saved or checked.
+    """
+    if publish:
+        reused, reuse_failed = apply_reuses(reuses, asset_map, prompt_index)
+        successful += reused
+        failed += reuse_failed
+        publish_sprites(all_jobs, asset_map)
+
+        with stage("save"):
+            asset_map.save()
+            prompt_index.save()
+
+    # ============================================================================
+    # SUMMARY
+    # ============================================================================
+
+    print("\n" + "=" * 80)
+    print(f"{title} COMPLETE")
+    print("=" * 80)
+    print(f"\n✅ Successful: {len(successful)} {noun}")
+    print(f"❌ Failed: {len(failed)} {noun}")
+
+    if successful:
+        print(f"\n📦 Generated {noun.title()}:")
+        for key in successful:
+            print(f"   ✓ {key}")
+
+    if failed:
+        print(f"\n⚠️  Failed {noun.title()}:")
+        for key in failed:
+            print(f"   ✗ {key}")
+
+    print(f"\n📁 Output directory: {output_label}")
+
+    violations = report_budgets(all_jobs, asset_map, surface_budgets) if publish else []
+    print()
+    return violations
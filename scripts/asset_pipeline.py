@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Shared asset pipeline helpers for the Peak AI image generators
+Writes content-hashed filenames and maintains the asset map imported by the app
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).parent.parent
+PUBLIC_DIR = ROOT_DIR / "public"
+ASSET_MAP_PATH = ROOT_DIR / "config" / "asset-map.json"
+PRECACHE_MANIFEST_PATH = PUBLIC_DIR / "precache-manifest.js"
+
+# Full-resolution renders; public/ only gets the rendered-size files derived from them
+MASTERS_DIR = ROOT_DIR / "assets" / "masters"
+
+# Local, uncommitted state: latency history, prompt index, render cache
+CACHE_DIR = ROOT_DIR / ".asset-cache"
+
+# Number of hex digits of the sha256 digest embedded in filenames
+HASH_LENGTH = 8
+
+MIME_TYPES = {
+    ".png": "image/png",
+    ".webp": "image/webp",
+    ".avif": "image/avif",
+    ".svg": "image/svg+xml",
+    ".ico": "image/x-icon",
+}
+
+# Interchangeable encodings of one raster, served under a single precache entry
+RASTER_EXTENSIONS = (".png", ".webp", ".avif")
+
+# Page surfaces (a job's "surface") whose assets the service worker precaches on
+# install; everything else is cached the first time a page loads it
+PRECACHE_SURFACES = {"app-shell"}
+
+
+def content_hash(data):
+    """Return the full sha256 hex digest of a bytes payload"""
+    return hashlib.sha256(data).hexdigest()
+
+
+def public_url(path):
+    """Map a file under public/ to the URL it is served from"""
+    return "/" + Path(path).resolve().relative_to(PUBLIC_DIR.resolve()).as_posix()
+
+
+def public_path(url):
+    """Map a served URL back to its file under public/"""
+    return PUBLIC_DIR / url.lstrip("/")
+
+
+def master_path(logical_url):
+    """Map a logical URL to its full-resolution master under assets/masters/"""
+    return MASTERS_DIR / logical_url.lstrip("/")
+
+
+def fingerprinted_name(path, digest):
+    """nav-home-24.png -> nav-home-24.<hash>.png"""
+    path = Path(path)
+    return path.with_name(f"{path.stem}.{digest[:HASH_LENGTH]}{path.suffix}")
+
+
+class AssetMap:
+    """
+    Logical asset URL -> fingerprinted URL, persisted as config/asset-map.json
+
+    Generators keep writing to their logical paths (e.g. /icons/navigation/nav-home-24.png);
+    publish() moves the file to its content-hashed name, drops the previous revision and
+    records the mapping so the app can serve every asset with Cache-Control: immutable.
+    """
+
+    def __init__(self, path=ASSET_MAP_PATH):
+        self.path = Path(path)
+        self.assets = {}
+        if self.path.exists():
+            with open(self.path) as f:
+                self.assets = json.load(f).get("assets", {})
+
+    def get(self, logical_url):
+        return self.assets.get(logical_url)
+
+    def resolve(self, logical_url):
+        """Return the fingerprinted file for a logical URL, or None if unpublished"""
+        entry = self.assets.get(logical_url)
+        if not entry:
+            return None
+        path = public_path(entry["url"])
+        return path if path.exists() else None
+
+    def publish(self, source_path, logical_url=None, surface=None):
+        """
+        Fingerprint a freshly written asset
+
+        Args:
+            source_path: File written by a generator (under public/)
+            logical_url: Stable URL the app refers to; defaults to the source path's URL
+            surface: Page surface that loads the asset, recorded for precache_entries()
+
+        Returns:
+            Path to the fingerprinted file
+        """
+        source_path = Path(source_path)
+        logical_url = logical_url or public_url(source_path)
+
+        with open(source_path, "rb") as f:
+            data = f.read()
+
+        digest = content_hash(data)
+        target = fingerprinted_name(public_path(logical_url), digest)
+
+        if source_path.resolve() != target.resolve():
+            os.makedirs(target.parent, exist_ok=True)
+            os.replace(source_path, target)
+
+        previous = self.assets.get(logical_url)
+        if previous and previous["url"] != public_url(target):
+            stale = public_path(previous["url"])
+            if stale.exists():
+                stale.unlink()
+
+        self.assets[logical_url] = {
+            "url": public_url(target),
+            "hash": digest,
+            "bytes": len(data),
+        }
+        if surface:
+            self.assets[logical_url]["surface"] = surface
+        return target
+
+    def unpublish(self, logical_url):
+        """Drop a logical URL and delete its fingerprinted file, if published"""
+        entry = self.assets.pop(logical_url, None)
+        if entry:
+            stale = public_path(entry["url"])
+            if stale.exists():
+                stale.unlink()
+
+    def precache_entries(self):
+        """
+        Group the assets the app shell loads into service-worker precache entries
+
+        Only assets of a PRECACHE_SURFACES surface are included, in their base
+        theme: theme variants (nav-home-24.dark.png) load only where a component
+        asks for that theme. Raster formats of one asset (nav-home-24.png / .webp /
+        .avif) share an entry keyed by the PNG URL the app requests, directly or
+        through /_next/image; the service worker stores the smallest variant the
+        browser can decode under that key. Where a traced .svg is published the app
+        loads that instead (lib/assets.ts vectorAssetUrl), so it replaces the rasters.
+        """
+        groups = {}
+        for logical_url, entry in self.assets.items():
+            stem, ext = os.path.splitext(logical_url)
+            if entry.get("surface") not in PRECACHE_SURFACES or "." in os.path.basename(stem):
+                continue
+            groups.setdefault(stem, {})[ext] = entry
+
+        entries = []
+        for _, variants in sorted(groups.items()):
+            if ".svg" in variants:
+                variants = {".svg": variants[".svg"]}
+            primary = variants.get(".png") or variants[sorted(variants)[0]]
+            entries.append({
+                "url": primary["url"],
+                "revision": primary["hash"][:HASH_LENGTH],
+                "bytes": primary["bytes"],
+                "variants": sorted(
+                    (
+                        {
+                            "url": entry["url"],
+                            "type": MIME_TYPES.get(ext, "application/octet-stream"),
+                            "bytes": entry["bytes"],
+                        }
+                        for ext, entry in variants.items()
+                    ),
+                    key=lambda variant: variant["bytes"],
+                ),
+            })
+        return entries
+
+    def write_precache_manifest(self, path=PRECACHE_MANIFEST_PATH):
+        """Write public/precache-manifest.js, loaded by public/sw.js via importScripts()"""
+        entries = self.precache_entries()
+        revision = content_hash(
+            "\n".join(f"{e['url']} {e['revision']}" for e in entries).encode()
+        )[:HASH_LENGTH]
+        manifest = {"revision": revision, "assets": entries}
+
+        with open(path, "w") as f:
+            f.write("// Generated by scripts/asset_pipeline.py - do not edit\n")
+            f.write(f"self.__PRECACHE_MANIFEST = {json.dumps(manifest, indent=2)}\n")
+
+        total = sum(e["bytes"] for e in entries)
+        print(f"📦 Precache manifest: {public_url(path)} rev {revision} "
+              f"({len(entries)} assets, {total / 1024:.0f} KB)")
+
+    def save(self):
+        os.makedirs(self.path.parent, exist_ok=True)
+        with open(self.path, "w") as f:
+            json.dump({"assets": dict(sorted(self.assets.items()))}, f, indent=2)
+            f.write("\n")
+        print(f"🗺️  Asset map: {self.path.relative_to(ROOT_DIR)} ({len(self.assets)} assets)")
+        self.write_precache_manifest()
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Opt-in CPU and memory profiling for the Peak AI asset pipeline
+Samples every thread's stack into flamegraph-compatible folded stacks, records
+per-stage time and tracemalloc peaks and, opt-in, the allocation growth of each
+top-level pipeline stage
+"""
+
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+
+from asset_pipeline import CACHE_DIR, ROOT_DIR
+
+PROFILE_DIR = CACHE_DIR / "profiles"
+
+SAMPLE_INTERVAL_SECONDS = 0.005
+# Allocation sites are grouped by their innermost frame; deeper tracebacks
+# multiply tracemalloc's per-allocation overhead for no extra detail
+TRACEBACK_DEPTH = 1
+TOP_ALLOCATIONS = 15
+
+_IGNORED_FILES = {tracemalloc.__file__, __file__}
+
+# Set while a profiled run is in progress
+_active = None
+
+
+@contextmanager
+def stage(name):
+    """
+    Mark a pipeline stage (request, decode, resample, encode, write, ...)
+
+    A no-op unless a profiled run is active, so call sites can stay instrumented.
+    """
+    if _active is None:
+        yield
+        return
+    with _active.stage(name):
+        yield
+
+
+@contextmanager
+def profile_run(enabled, label="run", allocations=False):
+    """
+    Profile everything inside the block when `enabled`, then write the report
+
+    Args:
+        allocations: Also diff tracemalloc snapshots around each top-level stage.
+            Snapshots cost far more than the stages they measure, so wall times
+            in an allocation profile are not representative.
+    """
+    global _active
+    if not enabled:
+        yield None
+        return
+
+    profiler = StageProfiler(PROFILE_DIR / f"{datetime.now():%Y%m%d-%H%M%S}-{label}", allocations=allocations)
+    _active = profiler
+    profiler.start()
+    try:
+        yield profiler
+    finally:
+        _active = None
+        profiler.stop()
+        profiler.report()
+
+
+class StageProfiler:
+    """
+    Sampling CPU profiler plus per-stage tracemalloc peaks and diffs
+
+    Stage attribution is per thread. Allocation diffs come from process-wide
+    snapshots, so run with --concurrency 1 when tracing a memory regression.
+    Samples taken while a thread is in the profiler's own bookkeeping are filed
+    under [profiler], not the stage it was measuring.
+    """
+
+    def __init__(self, output_dir, interval=SAMPLE_INTERVAL_SECONDS, allocations=False):
+        self.output_dir = output_dir
+        self.interval = interval
+        self.track_allocations = allocations
+        self.peak_bytes = 0
+        self.samples = {}
+        self.stage_seconds = {}
+        self.stage_calls = {}
+        self.stage_peaks = {}
+        self.allocations = {}
+        self._thread_stages = {}
+        self._thread_peaks = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._sampler = threading.Thread(target=self._sample, name="asset-profiler", daemon=True)
+
+    def start(self):
+        self._started = time.perf_counter()
+        tracemalloc.start(TRACEBACK_DEPTH)
+        self._sampler.start()
+
+    def stop(self):
+        self._stop.set()
+        self._sampler.join()
+        self.wall_seconds = time.perf_counter() - self._started
+        # Stages reset tracemalloc's peak, so the run-wide peak is the max of theirs
+        self.peak_bytes = max(self.peak_bytes, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+    @contextmanager
+    def stage(self, name):
+        tid = threading.get_ident()
+        stack = self._thread_stages.setdefault(tid, [])
+        stack.append(name)
+        path = "/".join(stack)
+        # reset_peak() is process-wide, so nested stages hand their peak to the parent
+        peaks = self._thread_peaks.setdefault(tid, [])
+        peaks.append(0)
+
+        # Nested stages are already covered by their top-level stage's snapshots
+        snapshot = self.track_allocations and len(stack) == 1
+        before = tracemalloc.take_snapshot() if snapshot else None
+        tracemalloc.reset_peak()
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            peak = max(tracemalloc.get_traced_memory()[1], peaks.pop())
+            after = tracemalloc.take_snapshot() if snapshot else None
+            stack.pop()
+            if peaks:
+                peaks[-1] = max(peaks[-1], peak)
+
+            with self._lock:
+                self.stage_seconds[path] = self.stage_seconds.get(path, 0.0) + elapsed
+                self.stage_calls[path] = self.stage_calls.get(path, 0) + 1
+                self.stage_peaks[path] = max(self.stage_peaks.get(path, 0), peak)
+                self.peak_bytes = max(self.peak_bytes, peak)
+                if snapshot:
+                    sites = self.allocations.setdefault(path, {})
+                    for stat in after.compare_to(before, "lineno"):
+                        frame = stat.traceback[0]
+                        # Snapshot.filter_traces() is too slow to run per stage; skip our own sites here
+                        if stat.size_diff > 0 and frame.filename not in _IGNORED_FILES:
+                            site = f"{self._short(frame.filename)}:{frame.lineno}"
+                            size, count = sites.get(site, (0, 0))
+                            sites[site] = (size + stat.size_diff, count + stat.count_diff)
+
+    def _sample(self):
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            for tid, frame in sys._current_frames().items():
+                if tid == own:
+                    continue
+                frames = []
+                overhead = False
+                while frame is not None:
+                    code = frame.f_code
+                    overhead = overhead or code.co_filename in _IGNORED_FILES
+                    frames.append(f"{code.co_name} ({self._short(code.co_filename)}:{frame.f_lineno})")
+                    frame = frame.f_back
+                stages = ["profiler"] if overhead else list(self._thread_stages.get(tid) or ["(no stage)"])
+                key = ";".join([f"[{s}]" for s in stages] + frames[::-1])
+                self.samples[key] = self.samples.get(key, 0) + 1
+
+    @staticmethod
+    def _short(filename):
+        try:
+            return os.path.relpath(filename, ROOT_DIR) if filename.startswith(str(ROOT_DIR)) else os.path.basename(filename)
+        except ValueError:
+            return os.path.basename(filename)
+
+    def report(self):
+        """Write cpu.folded (and allocations.txt) and print the per-stage summary"""
+        os.makedirs(self.output_dir, exist_ok=True)
+
+        # Brendan Gregg folded-stack format: flamegraph.pl, speedscope and inferno read it
+        with open(self.output_dir / "cpu.folded", "w") as f:
+            for key, count in sorted(self.samples.items()):
+                f.write(f"{key} {count}\n")
+
+        outputs = "cpu.folded"
+        if self.track_allocations:
+            outputs += ", allocations.txt"
+            with open(self.output_dir / "allocations.txt", "w") as f:
+                for path in sorted(self.allocations):
+                    f.write(f"[{path}] calls={self.stage_calls[path]} "
+                            f"time={self.stage_seconds[path]:.3f}s peak={self.stage_peaks[path] / 1024:.0f} KB\n")
+                    top = sorted(self.allocations[path].items(), key=lambda item: item[1][0], reverse=True)
+                    for site, (size, count) in top[:TOP_ALLOCATIONS]:
+                        f.write(f"    {size / 1024:>10.1f} KB  {count:>7} blocks  {site}\n")
+                    f.write("\n")
+
+        print("\n🔬 PROFILE")
+        print("-" * 80)
+        print(f"   Wall time: {self.wall_seconds:.2f}s   Peak traced memory: {self.peak_bytes / 1_048_576:.1f} MB")
+        for path in sorted(self.stage_seconds, key=self.stage_seconds.get, reverse=True):
+            print(f"   {path:<28} {self.stage_seconds[path]:>8.3f}s  {self.stage_calls[path]:>4} calls  "
+                  f"peak {self.stage_peaks[path] / 1_048_576:>7.1f} MB")
+        print(f"\n📁 Profile: {self.output_dir.relative_to(ROOT_DIR)}/ ({outputs})")
@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+"""
+On-demand asset service for the Peak AI app
+Serves any size, format and theme of a defined asset over local HTTP. A missing
+master is rendered through the image API once; variants are derived from it,
+concurrent requests for one variant share a single build, and built variants
+are kept in a bounded in-memory LRU backed by a bounded on-disk LRU
+"""
+
+import json
+import os
+import re
+import runpy
+import threading
+import time
+from collections import OrderedDict
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+import image_kernels
+from asset_derivatives import DERIVED_FORMATS, derived_size, load_master
+from asset_jobs import build_jobs
+from asset_pipeline import CACHE_DIR, HASH_LENGTH, MIME_TYPES, content_hash
+from gpt_image import GPTImageGenerator
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+
+# Generators whose definitions are served; the first to define an asset name wins
+GENERATOR_SCRIPTS = [
+    "generate-icons.py",
+    "generate-megamenu-graphics-gpt.py",
+    "generate-megamenu-graphics.py",
+]
+
+SERVED_DIR = CACHE_DIR / "served"
+
+DEFAULT_PORT = 8787
+MEMORY_CACHE_BYTES = 64 * 1024 * 1024
+DISK_CACHE_BYTES = 512 * 1024 * 1024
+MAX_SIZE = 1024
+
+# Image API renders of missing masters in flight at once
+RENDER_CONCURRENCY = 2
+
+# /{name}/{size}[.{theme}].{format}, e.g. /nav-home-24/96.dark.webp
+REQUEST_PATH = re.compile(
+    r"^/(?P<name>[\w-]+)/(?P<size>\d+)(?:\.(?P<theme>[\w-]+))?(?P<ext>\.(?:png|webp|avif))$"
+)
+
+
+def load_definitions(scripts=GENERATOR_SCRIPTS):
+    """
+    Index every defined asset by name (nav-home-24)
+
+    Returns:
+        {name: (job, {theme: recolor() parameters} from the same script)}
+    """
+    assets = {}
+    for script in scripts:
+        # Same as --watch: run the top level without main()
+        definitions = runpy.run_path(str(SCRIPTS_DIR / script), run_name="asset_definitions")
+        themes = definitions.get("THEMES", {})
+        jobs = build_jobs(definitions["ASSET_GROUPS"], definitions["MODEL"],
+                          quality=definitions["QUALITY"], themes=themes)
+        for job in jobs:
+            name = os.path.splitext(os.path.basename(job["url"]))[0]
+            assets.setdefault(name, (job, themes))
+    return assets
+
+
+class SingleFlight:
+    """Runs one call per key at a time; callers arriving meanwhile wait for its result"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, fn):
+        """
+        Returns:
+            (fn's result, whether it came from another caller's call)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = {"done": threading.Event()}
+
+        if not leader:
+            call["done"].wait()
+            if "error" in call:
+                raise call["error"]
+            return call["result"], True
+
+        try:
+            call["result"] = fn()
+            return call["result"], False
+        except Exception as e:
+            call["error"] = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call["done"].set()
+
+
+class MemoryLRU:
+    """Bytes by key, evicting the least recently used once over max_bytes"""
+
+    def __init__(self, max_bytes=MEMORY_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            data = self._items.get(key)
+            if data is not None:
+                self._items.move_to_end(key)
+            return data
+
+    def put(self, key, data):
+        if len(data) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._items.pop(key, None)
+            self.bytes += len(data) - (len(previous) if previous else 0)
+            self._items[key] = data
+            while self.bytes > self.max_bytes:
+                _, evicted = self._items.popitem(last=False)
+                self.bytes -= len(evicted)
+
+
+class DiskLRU:
+    """
+    Files named by key in one directory, evicting the least recently used
+
+    Recency is each file's mtime, touched on every hit, so it survives restarts.
+    """
+
+    def __init__(self, directory=SERVED_DIR, max_bytes=DISK_CACHE_BYTES):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+
+    def get(self, key):
+        path = self.directory / key
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+            return data
+        except FileNotFoundError:
+            return None
+
+    def put(self, key, data):
+        path = self.directory / key
+        temp = path.with_name(f".{key}.{threading.get_ident()}")
+        temp.write_bytes(data)
+        os.replace(temp, path)
+        with self._lock:
+            self._evict()
+
+    def _evict(self):
+        # Only runs after a build, so a directory scan is cheap next to the render
+        # Skips the dotted temp files of writes still in progress
+        files = [entry for entry in os.scandir(self.directory)
+                 if entry.is_file() and not entry.name.startswith(".")]
+        total = sum(entry.stat().st_size for entry in files)
+        for entry in sorted(files, key=lambda entry: entry.stat().st_mtime_ns):
+            if total <= self.max_bytes:
+                break
+            total -= entry.stat().st_size
+            try:
+                os.unlink(entry.path)
+            except FileNotFoundError:
+                pass
+
+
+class AssetService:
+    """Builds and caches (name, size, format, theme) variants of defined assets"""
+
+    def __init__(self, assets, render=True, memory_bytes=MEMORY_CACHE_BYTES,
+                 disk_bytes=DISK_CACHE_BYTES):
+        """
+        Args:
+            assets: From load_definitions()
+            render: Render missing masters through the image API; otherwise they 404
+        """
+        self.assets = assets
+        self.render = render
+        self.memory = MemoryLRU(memory_bytes)
+        self.disk = DiskLRU(SERVED_DIR, disk_bytes)
+        self._variants = SingleFlight()
+        self._masters = SingleFlight()
+        self._render_slots = threading.BoundedSemaphore(RENDER_CONCURRENCY)
+        self._generators = {}
+        self._generators_lock = threading.Lock()
+
+    def get(self, name, size, ext, theme=None):
+        """
+        Returns:
+            (bytes, version, source) where source is "memory", "disk", "shared"
+            (built for a concurrent request) or "built"
+
+        Raises:
+            LookupError: Unknown asset or theme, or no master with rendering off
+        """
+        if name not in self.assets:
+            raise LookupError(f"no asset named {name}")
+        job, themes = self.assets[name]
+        if theme and theme not in themes:
+            raise LookupError(f"no theme {theme} for {name}")
+        params = themes[theme] if theme else None
+
+        master = self._master(job)
+        # A re-rendered master or an edited theme gives every variant a new key
+        version = content_hash(json.dumps([master.stat().st_mtime_ns, params]).encode())[:HASH_LENGTH]
+        key = f"{name}-{size}{f'.{theme}' if theme else ''}.{version}{ext}"
+
+        data = self.memory.get(key)
+        if data is not None:
+            return data, version, "memory"
+        data = self.disk.get(key)
+        if data is not None:
+            self.memory.put(key, data)
+            return data, version, "disk"
+
+        data, shared = self._variants.do(key, lambda: self._build(job, size, ext, params, key))
+        return data, version, "shared" if shared else "built"
+
+    def _build(self, job, size, ext, params, key):
+        image = load_master(job["url"])
+        # Like the published derivatives, never upscale the master
+        side = derived_size({"rendered_px": size, "max_density": 1}, image.width)
+        scaled = image_kernels.downscale(image, [side])[side]
+        if params:
+            scaled = image_kernels.recolor(scaled, **params)
+        data = image_kernels.encode(scaled, DERIVED_FORMATS[ext])
+        self.disk.put(key, data)
+        self.memory.put(key, data)
+        return data
+
+    def _master(self, job):
+        path = job["path"]
+        if path.exists():
+            return path
+        if not self.render:
+            raise LookupError(f"no master for {job['url']}")
+        self._masters.do(job["url"], lambda: self._render_master(job))
+        return path
+
+    def _render_master(self, job):
+        with self._generators_lock:
+            if job["model"] not in self._generators:
+                self._generators[job["model"]] = GPTImageGenerator(model=job["model"])
+            generator = self._generators[job["model"]]
+
+        # Written beside the master and moved into place once complete, so
+        # _master() never sees a partial file
+        path = job["path"]
+        temp = path.with_name(f".{path.stem}.{threading.get_ident()}{path.suffix}")
+        os.makedirs(path.parent, exist_ok=True)
+        try:
+            with self._render_slots:
+                result = generator.generate(job["prompt"], size=job["size"], quality=job["quality"],
+                                            output_path=str(temp))
+            if not result:
+                raise RuntimeError(f"render of {job['url']} failed")
+            os.replace(temp, path)
+        finally:
+            if temp.exists():
+                temp.unlink()
+
+
+class AssetRequestHandler(BaseHTTPRequestHandler):
+    """GET /{name}/{size}[.{theme}].{format}"""
+
+    def do_GET(self):
+        started = time.monotonic()
+        match = REQUEST_PATH.match(unquote(urlsplit(self.path).path))
+        if not match:
+            return self._error(HTTPStatus.NOT_FOUND, "expected /{name}/{size}[.{theme}].{png|webp|avif}")
+        size = int(match["size"])
+        if not 1 <= size <= MAX_SIZE:
+            return self._error(HTTPStatus.BAD_REQUEST, f"size must be 1-{MAX_SIZE}")
+
+        try:
+            data, version, source = self.server.service.get(match["name"], size, match["ext"], match["theme"])
+        except LookupError as e:
+            return self._error(HTTPStatus.NOT_FOUND, str(e))
+        except Exception as e:
+            return self._error(HTTPStatus.BAD_GATEWAY, str(e))
+
+        etag = f'"{version}"'
+        status = HTTPStatus.NOT_MODIFIED if self.headers.get("If-None-Match") == etag else HTTPStatus.OK
+        self.send_response(status)
+        self.send_header("ETag", etag)
+        # URLs aren't fingerprinted, so browsers revalidate against the ETag
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("X-Asset-Cache", source)
+        if status == HTTPStatus.OK:
+            self.send_header("Content-Type", MIME_TYPES[match["ext"]])
+            self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        if status == HTTPStatus.OK:
+            self.wfile.write(data)
+        print(f"   {status.value} {self.path} ({source}, {(time.monotonic() - started) * 1000:.0f} ms)")
+
+    def _error(self, status, message):
+        body = (message + "\n").encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        print(f"   {status.value} {self.path} ({message})")
+
+    def log_message(self, format, *args):
+        # Requests are logged once in do_GET, with their cache source
+        pass
+
+
+def serve(host="127.0.0.1", port=DEFAULT_PORT, render=True, memory_bytes=MEMORY_CACHE_BYTES,
+          disk_bytes=DISK_CACHE_BYTES):
+    assets = load_definitions()
+    server = ThreadingHTTPServer((host, port), AssetRequestHandler)
+    server.service = AssetService(assets, render, memory_bytes, disk_bytes)
+
+    print(f"🛰️  Serving {len(assets)} assets on http://{host}:{port}/{{name}}/{{size}}[.{{theme}}].{{format}}")
+    print(f"   Cache: {memory_bytes / 1024 / 1024:.0f} MB memory, {disk_bytes / 1024 / 1024:.0f} MB "
+          f"in {SERVED_DIR.relative_to(CACHE_DIR.parent)}")
+    if not render:
+        print("   Missing masters are not rendered (--masters-only)")
+    print()
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Stopped serving")
+    finally:
+        server.server_close()
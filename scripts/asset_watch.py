@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Definition watching for the Peak AI asset generators' --watch mode
+Polls a generate-*.py script for edits, reloads its asset definitions without
+running main() and works out which jobs need a render or just a re-derive
+"""
+
+import runpy
+import time
+from pathlib import Path
+
+POLL_INTERVAL_SECONDS = 0.5
+
+
+def render_inputs(job):
+    """Everything that changes what the API returns for a job"""
+    return (job["prompt"], job["model"], job["size"], job["quality"])
+
+
+def derive_inputs(job):
+    """Everything that changes the served files cut from an existing master"""
+    return (job["budget"], job["themes"], job["vectorize"], job["sprite"], job["surface"])
+
+
+def diff_jobs(previous, current):
+    """
+    Compare two builds of the same script's jobs
+
+    Returns:
+        (jobs to render, jobs to re-derive from their master, removed urls)
+    """
+    before = {job["url"]: job for job in previous}
+    to_render = []
+    to_derive = []
+    for job in current:
+        old = before.get(job["url"])
+        if old is None or render_inputs(old) != render_inputs(job):
+            to_render.append(job)
+        elif derive_inputs(old) != derive_inputs(job):
+            to_derive.append(job)
+    current_urls = {job["url"] for job in current}
+    removed = [url for url in before if url not in current_urls]
+    return to_render, to_derive, removed
+
+
+class DefinitionWatcher:
+    """Reloads a generator script's module globals whenever the file changes"""
+
+    def __init__(self, script_path, interval=POLL_INTERVAL_SECONDS):
+        self.script_path = Path(script_path).resolve()
+        self.interval = interval
+        self._mtime = self._stat()
+
+    def _stat(self):
+        try:
+            return self.script_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            # Editors that save by rename briefly leave no file
+            return None
+
+    def load(self):
+        """Run the script's top level under a non-__main__ name, so main() doesn't run"""
+        return runpy.run_path(str(self.script_path), run_name="asset_definitions")
+
+    def wait(self):
+        """
+        Block until the script is saved again
+
+        Returns:
+            The reloaded module globals, or None if the edit doesn't load yet
+        """
+        while True:
+            time.sleep(self.interval)
+            mtime = self._stat()
+            if mtime is not None and mtime != self._mtime:
+                self._mtime = mtime
+                break
+        try:
+            return self.load()
+        except Exception as e:
+            print(f"⚠️  {self.script_path.name} failed to load: {e}")
+            return None
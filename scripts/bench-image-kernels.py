@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmarks for the local image kernels in image_kernels.py
+Runs each kernel several times, each in its own process, over 1024x1024 RGBA
+fixtures shaped like the megamenu renders, compares the best throughput and
+median peak memory against a stored baseline and exits non-zero on regressions
+past the tolerance
+
+The baseline is committed next to this script; record or refresh it with
+--update-baseline on the machine whose numbers it should hold
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import PIL
+from PIL import Image
+
+import image_kernels
+from asset_pipeline import ROOT_DIR
+
+BASELINE_PATH = Path(__file__).resolve().parent / "bench" / "baseline.json"
+
+# Processes per kernel, interleaved across kernels. Other load on the machine
+# only ever slows a run down, so the fastest repeat is the stable number
+REPEATS = 5
+
+FIXTURE_SIZE = 1024
+FIXTURE_COUNT = 3
+DOWNSCALE_SIZES = [512, 256, 192, 128, 64, 48, 32, 24, 16]
+# The icons' dark theme (generate-icons.py THEMES)
+RECOLOR_PARAMS = {"lightness": (0.55, 0.95), "chroma": 0.85}
+
+KERNELS = [
+    "decode",
+    "alpha-cleanup",
+    "downscale",
+    "recolor",
+    "encode-png",
+    "encode-webp",
+    "encode-avif",
+]
+
+
+def make_fixture(seed):
+    """
+    Synthetic stand-in for a megamenu render
+
+    Transparent background with a few gradient-filled, anti-aliased blobs, a soft
+    glow and faint alpha noise where the API's "transparent" output usually has it.
+    """
+    rng = np.random.default_rng(seed)
+    size = FIXTURE_SIZE
+    y, x = np.mgrid[0:size, 0:size].astype(np.float32) / size
+
+    rgb = np.zeros((size, size, 3), np.float32)
+    alpha = np.zeros((size, size), np.float32)
+    start = np.array([59, 130, 246], np.float32)
+    end = np.array([139, 92, 246], np.float32)
+
+    for _ in range(5):
+        cx, cy = rng.uniform(0.25, 0.75, 2)
+        radius = rng.uniform(0.08, 0.22)
+        distance = np.sqrt((x - cx) ** 2 + (y - cy) ** 2)
+        shape = np.clip((radius - distance) * size / 2.0, 0.0, 1.0)
+        glow = np.exp(-((distance / (radius * 1.6)) ** 2)) * 0.35
+        t = np.clip((x + y) / 2.0, 0.0, 1.0)[..., None]
+        color = start * (1 - t) + end * t
+        coverage = np.maximum(shape, glow)
+        rgb = rgb * (1 - coverage[..., None]) + color * coverage[..., None]
+        alpha = np.maximum(alpha, coverage)
+
+    alpha += rng.uniform(0, 4 / 255, alpha.shape) * (alpha < 0.02)
+    pixels = np.dstack([rgb, alpha * 255]).clip(0, 255).astype(np.uint8)
+    return Image.fromarray(pixels, "RGBA")
+
+
+def setup(kernel):
+    """Build kernel inputs; returns (callable, megapixels processed per call)"""
+    fixtures = [make_fixture(seed) for seed in range(FIXTURE_COUNT)]
+    megapixels = FIXTURE_SIZE * FIXTURE_SIZE * len(fixtures) / 1_000_000
+
+    if kernel == "decode":
+        encoded = [image_kernels.encode(f, "PNG", optimize=False) for f in fixtures]
+        return lambda: [image_kernels.decode(data) for data in encoded], megapixels
+    if kernel == "alpha-cleanup":
+        return lambda: [image_kernels.clean_alpha(f) for f in fixtures], megapixels
+    if kernel == "downscale":
+        return lambda: [image_kernels.downscale(f, DOWNSCALE_SIZES) for f in fixtures], megapixels
+    if kernel == "recolor":
+        return lambda: [image_kernels.recolor(f, **RECOLOR_PARAMS) for f in fixtures], megapixels
+    if kernel.startswith("encode-"):
+        fmt = kernel.split("-", 1)[1].upper()
+        return lambda: [image_kernels.encode(f, fmt) for f in fixtures], megapixels
+    raise ValueError(f"Unknown kernel: {kernel}")
+
+
+def _reset_peak_rss():
+    """Reset the kernel's peak-RSS counter (Linux); False where unsupported"""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def _rss_bytes(field):
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith(field + ":"):
+                return int(line.split()[1]) * 1024
+    raise OSError(field)
+
+
+def _peak_rss_bytes():
+    try:
+        return _rss_bytes("VmHWM")
+    except OSError:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def run_kernel(kernel, min_time):
+    """Child-process entry: time one kernel and report JSON on stdout"""
+    fn, megapixels = setup(kernel)
+
+    # Peak memory comes from the first call: later calls reuse pages that are
+    # already resident and wouldn't show up as RSS growth
+    if _reset_peak_rss():
+        baseline_rss = _rss_bytes("VmRSS")
+    else:
+        baseline_rss = _peak_rss_bytes()
+    fn()
+    peak_bytes = max(0, _peak_rss_bytes() - baseline_rss)
+
+    iterations = 0
+    started = time.perf_counter()
+    while True:
+        fn()
+        iterations += 1
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time:
+            break
+
+    print(json.dumps({
+        "kernel": kernel,
+        "iterations": iterations,
+        "seconds_per_op": elapsed / iterations,
+        "mpix_per_s": megapixels * iterations / elapsed,
+        "peak_mb": peak_bytes / 1_048_576,
+    }))
+
+
+def measure(kernel, min_time):
+    # A fixed glibc mmap threshold returns freed image buffers to the OS, so each
+    # kernel's first-call RSS growth isn't hidden by pages left over from setup
+    env = {**os.environ, "MALLOC_MMAP_THRESHOLD_": "131072"}
+    output = subprocess.run(
+        [sys.executable, __file__, "--run-kernel", kernel, "--min-time", str(min_time)],
+        check=True, capture_output=True, text=True, env=env,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def summarize(runs):
+    """One kernel's result from its repeats: the fastest run, and the median peak memory"""
+    best = max(runs, key=lambda run: run["mpix_per_s"])
+    return {
+        "kernel": best["kernel"],
+        "repeats": len(runs),
+        "seconds_per_op": best["seconds_per_op"],
+        "mpix_per_s": best["mpix_per_s"],
+        "mpix_per_s_runs": sorted(round(run["mpix_per_s"], 1) for run in runs),
+        "peak_mb": statistics.median(run["peak_mb"] for run in runs),
+    }
+
+
+def environment():
+    return {
+        "python": platform.python_version(),
+        "pillow": PIL.__version__,
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "system": platform.system(),
+    }
+
+
+def compare(result, baseline, tolerance, memory_tolerance):
+    """Return a list of regression messages for one kernel"""
+    if not baseline:
+        return ["not in the baseline; record it with --update-baseline"]
+    problems = []
+    floor = baseline["mpix_per_s"] * (1 - tolerance)
+    if result["mpix_per_s"] < floor:
+        problems.append(f"throughput {result['mpix_per_s']:.1f} < {floor:.1f} MP/s "
+                        f"(baseline {baseline['mpix_per_s']:.1f})")
+    # Small absolute slack so near-zero baselines don't flap on allocator noise
+    ceiling = baseline["peak_mb"] * (1 + memory_tolerance) + 1.0
+    if result["peak_mb"] > ceiling:
+        problems.append(f"peak memory {result['peak_mb']:.1f} > {ceiling:.1f} MB "
+                        f"(baseline {baseline['peak_mb']:.1f})")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark local image kernels")
+    parser.add_argument("--kernels", nargs="+", choices=KERNELS, default=KERNELS)
+    parser.add_argument("--min-time", type=float, default=0.5,
+                        help="Minimum seconds per repeat of each kernel (default: 0.5)")
+    parser.add_argument("--repeats", type=int, default=REPEATS,
+                        help=f"Runs per kernel; the fastest is compared (default: {REPEATS})")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH,
+                        help=f"Baseline file (default: {BASELINE_PATH.relative_to(ROOT_DIR)})")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="Store this run as the new baseline instead of comparing")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="Allowed throughput drop as a fraction (default: 0.2)")
+    parser.add_argument("--memory-tolerance", type=float, default=0.25,
+                        help="Allowed peak memory growth as a fraction (default: 0.25)")
+    parser.add_argument("--run-kernel", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_kernel:
+        run_kernel(args.run_kernel, args.min_time)
+        return
+
+    baseline = {}
+    if not args.update_baseline:
+        # Never pass by recording: a regression would become the new baseline
+        if not args.baseline.exists():
+            print(f"❌ No baseline at {args.baseline}; record one with --update-baseline")
+            sys.exit(1)
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    print("=" * 80)
+    print("PEAK AI IMAGE KERNEL BENCHMARKS")
+    print("=" * 80)
+    print()
+
+    if baseline and baseline.get("environment") != environment():
+        print(f"⚠️  Baseline was recorded on {baseline.get('environment')}; results may not be comparable\n")
+
+    # Round-robin, so a burst of load elsewhere hits one repeat of several
+    # kernels rather than every repeat of one
+    runs = {kernel: [] for kernel in args.kernels}
+    for _ in range(max(1, args.repeats)):
+        for kernel in args.kernels:
+            runs[kernel].append(measure(kernel, args.min_time))
+
+    results = {}
+    regressions = {}
+    for kernel in args.kernels:
+        result = results[kernel] = summarize(runs[kernel])
+        problems = [] if args.update_baseline else compare(
+            result, baseline["kernels"].get(kernel), args.tolerance, args.memory_tolerance)
+        status = "❌" if problems else "✓"
+        print(f"   {status} {kernel:<14} {result['mpix_per_s']:>9.1f} MP/s  "
+              f"{result['seconds_per_op'] * 1000:>9.1f} ms/op  peak {result['peak_mb']:>7.1f} MB  "
+              f"(runs {min(result['mpix_per_s_runs']):.1f}-{max(result['mpix_per_s_runs']):.1f} MP/s)")
+        for problem in problems:
+            print(f"      ↳ {problem}")
+        if problems:
+            regressions[kernel] = problems
+
+    if args.update_baseline:
+        # A --kernels subset only replaces the kernels it measured
+        kernels = {}
+        if args.baseline.exists():
+            with open(args.baseline) as f:
+                kernels = json.load(f)["kernels"]
+        os.makedirs(args.baseline.parent, exist_ok=True)
+        with open(args.baseline, "w") as f:
+            json.dump({"environment": environment(), "kernels": {**kernels, **results}}, f, indent=2)
+            f.write("\n")
+        print(f"\n💾 Baseline written: {args.baseline}")
+
+    print()
+    if regressions:
+        print(f"❌ {len(regressions)} kernel(s) regressed: {', '.join(regressions)}")
+        sys.exit(1)
+    print("✅ No regressions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Generate the Peak One app icon set from the brand logo master
+Derives every PWA, maskable and apple-touch size plus a multi-resolution
+favicon.ico in one pass, then writes the matching manifest.json icons, the
+link metadata app/layout.tsx reads from config/app-icons.json and the versioned
+URLs public/sw.js caches from public/app-icons.js
+"""
+
+import io
+import json
+import math
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image
+
+import image_kernels
+from asset_derivatives import load_master
+from asset_pipeline import HASH_LENGTH, ROOT_DIR, PUBLIC_DIR, content_hash, public_url
+
+# Logical URL of the brand master every icon is derived from (see generate-icons.py)
+BRAND_MASTER = "/icons/brand/peak-logo-512.png"
+
+PWA_DIR = PUBLIC_DIR / "icons" / "pwa"
+MANIFEST_PATH = PUBLIC_DIR / "manifest.json"
+FAVICON_PATH = ROOT_DIR / "app" / "favicon.ico"
+APP_ICONS_PATH = ROOT_DIR / "config" / "app-icons.json"
+SW_ICONS_PATH = PUBLIC_DIR / "app-icons.js"
+
+PWA_SIZES = [72, 96, 128, 144, 152, 192, 384, 512]
+# PWA sizes also linked as <link rel="icon">, next to app/favicon.ico
+LINK_ICON_SIZES = [192]
+MASKABLE_SIZES = [192, 512]
+APPLE_TOUCH_SIZES = [180, 167, 152]
+FAVICON_SIZES = [16, 32, 48]
+
+# manifest.json background_color; maskable and apple-touch icons must be opaque
+BACKGROUND = (255, 255, 255, 255)
+
+# Maskable icons are cropped to as little as a centered circle of 80% diameter,
+# which a square logo fits inside at 0.8 / sqrt(2) of the icon
+MASKABLE_CONTENT = 0.8 / math.sqrt(2)
+# iOS rounds the corners itself; keep the logo clear of them
+APPLE_TOUCH_CONTENT = 0.8
+
+_MANIFEST_ICONS = re.compile(r'^  "icons": \[\n.*?^  \](,?)$', re.M | re.S)
+
+
+def icon_targets():
+    """
+    Every PNG in the set
+
+    Returns:
+        [{"name", "size", "content": logo px, "background", "purpose": manifest
+          purpose or None, "rel": "icon" / "apple" link metadata key or None}]
+    """
+    targets = [
+        {"name": f"icon-{size}.png", "size": size, "content": size, "background": None,
+         "purpose": "any", "rel": "icon" if size in LINK_ICON_SIZES else None}
+        for size in PWA_SIZES
+    ]
+    targets += [
+        {"name": f"maskable-icon-{size}.png", "size": size, "content": round(size * MASKABLE_CONTENT),
+         "background": BACKGROUND, "purpose": "maskable", "rel": None}
+        for size in MASKABLE_SIZES
+    ]
+    targets += [
+        {"name": f"apple-touch-icon-{size}.png", "size": size, "content": round(size * APPLE_TOUCH_CONTENT),
+         "background": BACKGROUND, "purpose": None, "rel": "apple"}
+        for size in APPLE_TOUCH_SIZES
+    ]
+    return targets
+
+
+def compose(logo, size, background):
+    """Center a downscaled logo on a size x size canvas"""
+    if logo.width == size and background is None:
+        return logo
+    canvas = Image.new("RGBA", (size, size), background or (0, 0, 0, 0))
+    offset = (size - logo.width) // 2
+    canvas.alpha_composite(logo, (offset, offset))
+    return canvas
+
+
+def favicon(scaled):
+    """Multi-resolution .ico carrying each downscaled size as its own frame"""
+    frames = [scaled[size] for size in sorted(FAVICON_SIZES, reverse=True)]
+    buffer = io.BytesIO()
+    frames[0].save(buffer, "ICO", sizes=[frame.size for frame in frames], append_images=frames[1:])
+    return buffer.getvalue()
+
+
+def write_manifest_icons(icons):
+    """Replace only the top-level "icons" array, leaving the rest of manifest.json as written"""
+    text = MANIFEST_PATH.read_text()
+    # Drop the wrapping braces, keeping the two-space indent of a top-level key
+    block = json.dumps({"icons": icons}, indent=2)[2:-2]
+    # Keep the comma only if "icons" wasn't the last key
+    text, count = _MANIFEST_ICONS.subn(lambda match: block + match.group(1), text, count=1)
+    if not count:
+        raise ValueError(f"no top-level \"icons\" array in {MANIFEST_PATH}")
+    MANIFEST_PATH.write_text(text)
+
+
+def main():
+    print("=" * 80)
+    print("PEAK ONE APP ICON GENERATION")
+    print("=" * 80)
+    print()
+
+    master = load_master(BRAND_MASTER)
+    targets = icon_targets()
+
+    # One downscale pass over every logo size the set needs
+    scaled = image_kernels.downscale(master, {t["content"] for t in targets} | set(FAVICON_SIZES))
+
+    def render(target):
+        icon = compose(scaled[target["content"]], target["size"], target["background"])
+        data = image_kernels.encode(icon, "PNG")
+        (PWA_DIR / target["name"]).write_bytes(data)
+        return data
+
+    PWA_DIR.mkdir(parents=True, exist_ok=True)
+    with ThreadPoolExecutor() as pool:
+        favicon_job = pool.submit(favicon, scaled)
+        rendered = list(pool.map(render, targets))
+        FAVICON_PATH.write_bytes(favicon_job.result())
+
+    manifest_icons = []
+    links = {"icon": [], "apple": []}
+    versioned = {}
+    for target, data in zip(targets, rendered):
+        # Stable URLs (sw.js and installed apps refer to them), versioned so a
+        # re-derived icon isn't served from a stale cache
+        url = f"{public_url(PWA_DIR / target['name'])}?v={content_hash(data)[:HASH_LENGTH]}"
+        versioned[target["name"]] = url
+        sizes = f"{target['size']}x{target['size']}"
+        if target["purpose"]:
+            manifest_icons.append({"src": url, "sizes": sizes, "type": "image/png", "purpose": target["purpose"]})
+        if target["rel"]:
+            links[target["rel"]].append({"url": url, "sizes": sizes, "type": "image/png"})
+        print(f"   ✓ {target['name']:<28} {len(data) / 1024:>6.1f} KB")
+    print(f"   ✓ {'app/favicon.ico':<28} {FAVICON_PATH.stat().st_size / 1024:>6.1f} KB "
+          f"({', '.join(f'{size}px' for size in FAVICON_SIZES)})")
+
+    write_manifest_icons(manifest_icons)
+    with open(APP_ICONS_PATH, "w") as f:
+        json.dump(links, f, indent=2)
+        f.write("\n")
+    # The service worker re-installs when an imported script changes, so new
+    # icons replace the cached ones instead of being shadowed by them
+    with open(SW_ICONS_PATH, "w") as f:
+        f.write("// Generated by scripts/generate-app-icons.py - do not edit\n")
+        f.write(f"self.__APP_ICONS = {json.dumps(versioned, indent=2)}\n")
+
+    print(f"\n📱 {MANIFEST_PATH.relative_to(ROOT_DIR)}: {len(manifest_icons)} icons")
+    print(f"🔗 {APP_ICONS_PATH.relative_to(ROOT_DIR)}: {len(links['icon'])} icon, "
+          f"{len(links['apple'])} apple-touch links")
+    print(f"⚙️  {public_url(SW_ICONS_PATH)}: {len(versioned)} versioned URLs for sw.js")
+    print()
+
+
+if __name__ == "__main__":
+    main()
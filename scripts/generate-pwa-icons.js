@@ -1,7 +1,9 @@
 /**
- * PWA Icon Generator Script
+ * PWA Shortcut Icon Generator Script
  *
- * This script generates PWA icons from SVG templates.
+ * This script generates the manifest shortcut and notification badge icons
+ * from SVG templates. The app icons themselves (PWA, maskable, apple-touch and
+ * favicon.ico) are derived from the brand logo by scripts/generate-app-icons.py.
  * Run: node scripts/generate-pwa-icons.js
  */
 
@@ -9,31 +11,6 @@ const fs = require('fs');
 const path = require('path');
 const sharp = require('sharp');
 
-// Icon sizes needed for PWA
-const ICON_SIZES = [72, 96, 128, 144, 152, 192, 384, 512];
-
-// SVG template for the mountain/peak icon
-const generateIconSvg = (size, maskable = false) => {
-  const padding = maskable ? size * 0.15 : 0;
-  const innerSize = size - (padding * 2);
-
-  return `<svg xmlns="http://www.w3.org/2000/svg" width="${size}" height="${size}" viewBox="0 0 ${size} ${size}">
-  <defs>
-    <linearGradient id="grad" x1="0%" y1="0%" x2="100%" y2="100%">
-      <stop offset="0%" style="stop-color:#3b82f6;stop-opacity:1" />
-      <stop offset="100%" style="stop-color:#8b5cf6;stop-opacity:1" />
-    </linearGradient>
-  </defs>
-  <rect width="${size}" height="${size}" rx="${size * 0.22}" fill="url(#grad)"/>
-  <g transform="translate(${padding + innerSize * 0.15}, ${padding + innerSize * 0.15})">
-    <path
-      d="M${innerSize * 0.35} ${innerSize * 0.1} L${innerSize * 0.65} ${innerSize * 0.6} L${innerSize * 0.5} ${innerSize * 0.6} L${innerSize * 0.35} ${innerSize * 0.35} L${innerSize * 0.2} ${innerSize * 0.6} L${innerSize * 0.05} ${innerSize * 0.6} Z"
-      fill="white"
-    />
-  </g>
-</svg>`;
-};
-
 // Shortcut icon templates
 const shortcutIcons = {
   messages: (size) => `<svg xmlns="http://www.w3.org/2000/svg" width="${size}" height="${size}" viewBox="0 0 ${size} ${size}">
@@ -80,31 +57,7 @@ if (!fs.existsSync(outputDir)) {
 }
 
 async function generateIcons() {
-  console.log('Generating PWA icons...\n');
-
-  // Generate main icons
-  for (const size of ICON_SIZES) {
-    const svg = generateIconSvg(size, false);
-    const pngPath = path.join(outputDir, `icon-${size}.png`);
-
-    await sharp(Buffer.from(svg))
-      .png()
-      .toFile(pngPath);
-
-    console.log(`Generated icon-${size}.png`);
-  }
-
-  // Generate maskable icons
-  for (const size of [192, 512]) {
-    const svg = generateIconSvg(size, true);
-    const pngPath = path.join(outputDir, `maskable-icon-${size}.png`);
-
-    await sharp(Buffer.from(svg))
-      .png()
-      .toFile(pngPath);
-
-    console.log(`Generated maskable-icon-${size}.png`);
-  }
+  console.log('Generating PWA shortcut icons...\n');
 
   // Generate shortcut icons
   for (const [name, generator] of Object.entries(shortcutIcons)) {
@@ -130,7 +83,7 @@ async function generateIcons() {
 
   console.log('Generated badge-72.png');
 
-  console.log('\n✅ All PWA icons generated successfully!');
+  console.log('\n✅ All PWA shortcut icons generated successfully!');
 }
 
 generateIcons().catch(console.error);
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+OpenAI image generation client shared by the Peak AI asset generators
+Supports GPT Image 1 and DALL-E 3 through /v1/images/generations
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+import os
+import base64
+
+from asset_profiling import stage
+
+# Keep-alive connections held per host; covers --concurrency up to this
+POOL_SIZE = 8
+
+
+class GPTImageGenerator:
+    def __init__(self, api_key=None, model="gpt-image-1", pool_size=POOL_SIZE):
+        # Get API key from parameter, environment, or fallback to error
+        self.api_key = api_key or os.environ.get('OPENAI_API_KEY')
+        if not self.api_key:
+            raise ValueError("OpenAI API key required. Set OPENAI_API_KEY environment variable or pass api_key parameter.")
+        self.endpoint = "https://api.openai.com/v1/images/generations"
+        self.model = model
+
+        # One pooled session, so repeat requests skip the TCP/TLS handshake
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+
+    def generate(self, prompt, size="1024x1024", quality="high", output_path=None, timeout=60):
+        """
+        Generate image with the configured model
+
+        Args:
+            prompt: Text description of image to generate
+            size: Image dimensions (gpt-image-1: 1024x1024, 1536x1024, 1024x1536;
+                  dall-e-3: 1024x1024, 1024x1792, 1792x1024)
+            quality: gpt-image-1: "low", "medium" or "high"; dall-e-3: "standard" or "hd"
+            output_path: Where to save the image
+            timeout: Seconds to wait for the API response
+
+        Returns:
+            Path to saved image or None on failure
+        """
+        try:
+            headers = {
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json"
+            }
+
+            payload = {
+                "model": self.model,
+                "prompt": prompt,
+                "n": 1,
+                "size": size,
+                "quality": quality
+            }
+
+            print(f"🎨 Generating: {output_path}")
+            print(f"   Prompt: {prompt[:80]}...")
+
+            with stage("request"):
+                response = self.session.post(
+                    self.endpoint,
+                    headers=headers,
+                    json=payload,
+                    timeout=timeout
+                )
+
+            if response.status_code == 200:
+                result = response.json()
+
+                if "data" in result and len(result["data"]) > 0:
+                    image_data = result["data"][0]
+
+                    # Handle both URL and base64 responses
+                    if "b64_json" in image_data:
+                        # Decode base64 image data
+                        with stage("decode"):
+                            image_bytes = base64.b64decode(image_data["b64_json"])
+
+                        with stage("write"):
+                            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+
+                            with open(output_path, "wb") as f:
+                                f.write(image_bytes)
+
+                        print(f"   ✓ Saved: {output_path}\n")
+                        return output_path
+
+                    elif "url" in image_data:
+                        image_url = image_data["url"]
+
+                        # Download and save image
+                        with stage("download"):
+                            img_response = self.session.get(image_url, timeout=30)
+                        if img_response.status_code == 200:
+                            with stage("write"):
+                                os.makedirs(os.path.dirname(output_path), exist_ok=True)
+
+                                with open(output_path, "wb") as f:
+                                    f.write(img_response.content)
+
+                            print(f"   ✓ Saved: {output_path}\n")
+                            return output_path
+                        else:
+                            print("   ✗ Failed to download image\n")
+                            return None
+                    else:
+                        print("   ✗ No url or b64_json in response\n")
+                        return None
+                else:
+                    print("   ❌ No image data in response\n")
+                    return None
+            else:
+                print(f"   ❌ API Error {response.status_code}: {response.text[:200]}\n")
+                return None
+
+        except Exception as e:
+            print(f"   ❌ Exception: {str(e)}\n")
+            return None
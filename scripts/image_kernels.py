@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Local image kernels for the Peak AI asset pipeline
+Decode, alpha cleanup, multi-size downscale, OKLCH recolor and encode for the
+1024x1024 RGBA masters returned by the image API
+"""
+
+import io
+
+import numpy as np
+from PIL import Image
+
+from asset_profiling import stage
+
+# Alpha at or below this is treated as background, at or above ALPHA_OPAQUE as solid
+ALPHA_FLOOR = 8
+ALPHA_OPAQUE = 248
+
+# sRGB <-> OKLab matrices (Björn Ottosson, https://bottosson.github.io/posts/oklab/)
+_LMS_FROM_LINEAR = np.array([
+    [0.4122214708, 0.5363325363, 0.0514459929],
+    [0.2119034982, 0.6806995451, 0.1073969566],
+    [0.0883024619, 0.2817188376, 0.6299787005],
+])
+_OKLAB_FROM_LMS = np.array([
+    [0.2104542553, 0.7936177850, -0.0040720468],
+    [1.9779984951, -2.4285922050, 0.4505937099],
+    [0.0259040371, 0.7827717662, -0.8086757660],
+])
+_LMS_FROM_OKLAB = np.array([
+    [1.0, 0.3963377774, 0.2158037573],
+    [1.0, -0.1055613458, -0.0638541728],
+    [1.0, -0.0894841775, -1.2914855480],
+])
+_LINEAR_FROM_LMS = np.array([
+    [4.0767416621, -3.3077115913, 0.2309699292],
+    [-1.2684380046, 2.6097574011, -0.3413193965],
+    [-0.0041960863, -0.7034186147, 1.7076147010],
+])
+
+# recolor() works on 8-bit channels, so both transfer curves are lookup tables:
+# sRGB byte -> linear, and linear quantized to 4096 steps -> sRGB byte
+_LINEAR_STEPS = 4096
+_BYTES = np.arange(256) / 255.0
+_LINEAR_FROM_BYTE = np.where(_BYTES <= 0.04045, _BYTES / 12.92,
+                             ((_BYTES + 0.055) / 1.055) ** 2.4).astype(np.float32)
+_STEPS = np.arange(_LINEAR_STEPS) / (_LINEAR_STEPS - 1)
+_BYTE_FROM_LINEAR = np.round(255 * np.where(_STEPS <= 0.0031308, _STEPS * 12.92,
+                                            1.055 * _STEPS ** (1 / 2.4) - 0.055)).astype(np.uint8)
+
+ENCODE_OPTIONS = {
+    "PNG": {"optimize": True},
+    "WEBP": {"quality": 90, "method": 4},
+    "AVIF": {"quality": 60, "speed": 6},
+}
+
+
+def decode(data):
+    """Decode image bytes to a fully loaded RGBA image"""
+    with stage("decode-image"):
+        image = Image.open(io.BytesIO(data))
+        image.load()
+        return image.convert("RGBA") if image.mode != "RGBA" else image
+
+
+def clean_alpha(image, floor=ALPHA_FLOOR, opaque=ALPHA_OPAQUE):
+    """
+    Snap near-transparent and near-opaque alpha and clear hidden color
+
+    Generated "transparent" backgrounds carry faint alpha noise and arbitrary RGB
+    under alpha 0; both bloat encoded files and fringe when downscaled.
+    """
+    with stage("alpha-cleanup"):
+        pixels = np.asarray(image).copy()
+        alpha = pixels[..., 3]
+        alpha[alpha <= floor] = 0
+        alpha[alpha >= opaque] = 255
+        pixels[alpha == 0] = 0
+        return Image.fromarray(pixels, "RGBA")
+
+
+def fit_square(image):
+    """Center a non-square image on a transparent square canvas"""
+    if image.width == image.height:
+        return image
+    side = max(image.size)
+    canvas = Image.new("RGBA", (side, side), (0, 0, 0, 0))
+    canvas.paste(image, ((side - image.width) // 2, (side - image.height) // 2))
+    return canvas
+
+
+def downscale(image, sizes):
+    """
+    Resize a square master to every size in `sizes`
+
+    Works largest first, box-reducing the shared source by whole factors while it
+    stays at least 2x the next size so Lanczos only covers the last < 4x step.
+    Resampling happens in premultiplied alpha so transparent edges don't darken.
+
+    Returns:
+        {size: RGBA image}
+    """
+    with stage("downscale"):
+        source = image.convert("RGBa")
+        results = {}
+        for size in sorted(set(sizes), reverse=True):
+            factor = source.width // (size * 2)
+            if factor >= 2:
+                source = source.reduce(factor)
+            results[size] = source.resize((size, size), Image.Resampling.LANCZOS).convert("RGBA")
+        return results
+
+
+def recolor(image, hue_shift=0.0, chroma=1.0, lightness=None):
+    """
+    Remap an RGBA image's colors in OKLCH, leaving alpha untouched
+
+    Hue rotation, chroma scaling and the lightness remap are all affine in OKLab,
+    so they fold into the matrix between the two cube-root steps.
+
+    Args:
+        hue_shift: Degrees added to every hue, so gradients keep their spread
+        chroma: Saturation multiplier
+        lightness: (low, high) range that OKLab lightness 0..1 is mapped onto
+    """
+    with stage("recolor"):
+        low, high = lightness or (0.0, 1.0)
+        angle = np.radians(hue_shift)
+        adjust = np.array([
+            [high - low, 0.0, 0.0],
+            [0.0, chroma * np.cos(angle), -chroma * np.sin(angle)],
+            [0.0, chroma * np.sin(angle), chroma * np.cos(angle)],
+        ])
+        to_lab = (_OKLAB_FROM_LMS.T @ adjust.T @ _LMS_FROM_OKLAB.T).astype(np.float32)
+        offset = (np.array([low, 0.0, 0.0]) @ _LMS_FROM_OKLAB.T).astype(np.float32)
+
+        pixels = np.asarray(image)
+        result = np.zeros_like(pixels)
+        # Fully transparent pixels keep cleared color (see clean_alpha)
+        visible = pixels[..., 3] > 0
+        linear = _LINEAR_FROM_BYTE[pixels[visible][:, :3]]
+        lms = np.cbrt(linear @ _LMS_FROM_LINEAR.T.astype(np.float32)) @ to_lab + offset
+        linear = np.clip((lms ** 3) @ _LINEAR_FROM_LMS.T.astype(np.float32), 0.0, 1.0)
+        result[visible, :3] = _BYTE_FROM_LINEAR[(linear * (_LINEAR_STEPS - 1) + 0.5).astype(np.intp)]
+        result[visible, 3] = pixels[visible][:, 3]
+        return Image.fromarray(result, "RGBA")
+
+
+def encode(image, fmt, **options):
+    """Encode an image to PNG, WEBP or AVIF bytes"""
+    with stage(f"encode-{fmt.lower()}"):
+        buffer = io.BytesIO()
+        image.save(buffer, fmt, **{**ENCODE_OPTIONS.get(fmt, {}), **options})
+        return buffer.getvalue()
+
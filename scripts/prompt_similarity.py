@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Near-duplicate prompt detection for the Peak AI asset generators
+MinHash signatures over word shingles of normalized prompt text, bucketed with
+LSH bands so each lookup only compares against likely matches
+"""
+
+import functools
+import hashlib
+import json
+import os
+import random
+import re
+
+from asset_pipeline import CACHE_DIR
+
+PROMPT_INDEX_PATH = CACHE_DIR / "prompts.json"
+
+SHINGLE_SIZE = 3
+NUM_PERMUTATIONS = 128
+# 32 bands x 4 rows: pairs above ~0.5 Jaccard almost always share a bucket
+LSH_BANDS = 32
+
+# Prompts at or above this Jaccard similarity are offered for reuse
+DUPLICATE_THRESHOLD = 0.7
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+# Fixed seed so signatures are stable across runs
+_rng = random.Random(1729)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(NUM_PERMUTATIONS)
+]
+
+
+def normalize_prompt(text):
+    """Lowercase, drop punctuation (keeping hex colors) and collapse whitespace"""
+    text = text.lower()
+    text = re.sub(r"[^a-z0-9#\s-]", " ", text)
+    return " ".join(text.split())
+
+
+def shingles(text, size=SHINGLE_SIZE):
+    words = normalize_prompt(text).split()
+    if len(words) < size:
+        return {" ".join(words)}
+    return {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+def jaccard(a, b):
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+@functools.lru_cache(maxsize=1024)
+def signature(prompt):
+    """Shingles and MinHash signature of a prompt, memoized across index lookups"""
+    shingle_set = frozenset(shingles(prompt))
+    return shingle_set, minhash(shingle_set)
+
+
+def minhash(shingle_set):
+    hashes = [
+        int.from_bytes(hashlib.blake2b(s.encode(), digest_size=4).digest(), "big")
+        for s in shingle_set
+    ]
+    return [
+        min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes)
+        for a, b in _PERMUTATIONS
+    ]
+
+
+class PromptIndex:
+    """
+    MinHash/LSH index of prompts keyed by asset
+
+    Candidates from shared LSH buckets are confirmed with exact shingle Jaccard,
+    which is cheap at prompt sizes and avoids MinHash estimation noise.
+    """
+
+    def __init__(self, bands=LSH_BANDS):
+        self.bands = bands
+        self.rows = NUM_PERMUTATIONS // bands
+        self.entries = {}
+        self.buckets = {}
+
+    def add(self, key, prompt, **meta):
+        self.remove(key)
+        shingle_set, minhashes = signature(prompt)
+        self.entries[key] = {"prompt": prompt, "shingles": shingle_set, "signature": minhashes, **meta}
+        for band in self._bands(minhashes):
+            self.buckets.setdefault(band, set()).add(key)
+
+    def remove(self, key):
+        entry = self.entries.pop(key, None)
+        if entry:
+            for band in self._bands(entry["signature"]):
+                self.buckets.get(band, set()).discard(key)
+
+    def query(self, prompt, threshold=DUPLICATE_THRESHOLD, exclude=None):
+        """
+        Find indexed prompts similar to `prompt`
+
+        Returns:
+            [(key, similarity)] sorted most similar first
+        """
+        shingle_set, minhashes = signature(prompt)
+        candidates = set()
+        for band in self._bands(minhashes):
+            candidates |= self.buckets.get(band, set())
+        candidates.discard(exclude)
+
+        matches = []
+        for key in candidates:
+            similarity = jaccard(shingle_set, self.entries[key]["shingles"])
+            if similarity >= threshold:
+                matches.append((key, similarity))
+        return sorted(matches, key=lambda match: match[1], reverse=True)
+
+    def _bands(self, minhashes):
+        for band in range(self.bands):
+            rows = minhashes[band * self.rows:(band + 1) * self.rows]
+            yield (band, tuple(rows))
+
+    # Persistence keeps only the prompt and metadata; signatures are rebuilt on load
+
+    @classmethod
+    def load(cls, path=PROMPT_INDEX_PATH):
+        index = cls()
+        if path.exists():
+            with open(path) as f:
+                for key, entry in json.load(f).items():
+                    prompt = entry.pop("prompt")
+                    index.add(key, prompt, **entry)
+        return index
+
+    def save(self, path=PROMPT_INDEX_PATH):
+        os.makedirs(path.parent, exist_ok=True)
+        data = {
+            key: {k: v for k, v in entry.items() if k not in ("shingles", "signature")}
+            for key, entry in self.entries.items()
+        }
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2)
@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+Serve Peak AI assets on demand
+Local HTTP service that builds any size, format and theme of the assets defined
+in the generate-*.py scripts, e.g. http://127.0.0.1:8787/nav-home-24/96.dark.webp
+"""
+
+import argparse
+
+from asset_server import DEFAULT_PORT, DISK_CACHE_BYTES, MEMORY_CACHE_BYTES, serve
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve Peak AI assets on demand")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--masters-only", action="store_true",
+                        help="404 assets without a master instead of rendering them through the API")
+    parser.add_argument("--memory-mb", type=int, default=MEMORY_CACHE_BYTES // (1024 * 1024),
+                        help="In-memory LRU size (default: %(default)s)")
+    parser.add_argument("--disk-mb", type=int, default=DISK_CACHE_BYTES // (1024 * 1024),
+                        help="On-disk LRU size under .asset-cache/served/ (default: %(default)s)")
+    args = parser.parse_args()
+
+    serve(args.host, args.port, render=not args.masters_only,
+          memory_bytes=args.memory_mb * 1024 * 1024, disk_bytes=args.disk_mb * 1024 * 1024)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Tests for batch submission and collection (asset_batch.py, asset_jobs.py)
+Run from the repository root with: python -m pytest -q scripts/
+"""
+
+import io
+import json
+import types
+
+import pytest
+from PIL import Image
+
+import asset_batch
+import asset_jobs
+from asset_batch import LocalBatchClient, request_line, result_image, write_job_file
+from asset_history import LatencyHistory
+from asset_pipeline import AssetMap
+from prompt_similarity import PromptIndex
+
+
+def _job(key, prompt, model="gpt-image-1", size="64x32"):
+    return {"key": key, "url": f"/icons/test/{key}", "prompt": prompt, "model": model, "size": size,
+            "quality": "high", "path": None, "budget": None, "vectorize": False, "themes": {},
+            "surface": "app-shell"}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """The local stand-in's clock, advanced by hand instead of waiting out each request"""
+    clock = types.SimpleNamespace(now=1_000.0)
+    monkeypatch.setattr(asset_batch, "time", types.SimpleNamespace(time=lambda: clock.now))
+    return clock
+
+
+def test_request_lines_ask_dall_e_for_base64():
+    assert "response_format" not in request_line(_job("a.png", "a"))["body"]
+    line = request_line(_job("b.png", "b", model="dall-e-3"))
+    assert line["custom_id"] == "/icons/test/b.png"
+    assert line["body"]["response_format"] == "b64_json"
+
+
+def test_local_client_submit_poll_and_results(tmp_path, clock):
+    jobs = [_job("a.png", "first prompt"), _job("b.png", "second prompt")]
+    job_file = write_job_file(jobs, tmp_path / "requests.jsonl")
+    assert [json.loads(line)["custom_id"] for line in job_file.read_text().splitlines()] == [
+        "/icons/test/a.png", "/icons/test/b.png",
+    ]
+
+    client = LocalBatchClient(tmp_path / "local")
+    batch = client.create(client.upload(job_file))
+    assert batch["status"] == "in_progress"
+    assert batch["request_counts"] == {"total": 2, "completed": 0, "failed": 0}
+    assert batch["output_file_id"] is None
+
+    clock.now += asset_batch.LOCAL_SECONDS_PER_REQUEST
+    assert client.retrieve(batch["id"])["request_counts"]["completed"] == 1
+
+    # A new client over the same root picks the batch up, like a --collect run
+    clock.now += asset_batch.LOCAL_SECONDS_PER_REQUEST
+    batch = LocalBatchClient(tmp_path / "local").retrieve(batch["id"])
+    assert batch["status"] == "completed"
+
+    results = list(client.results(batch["output_file_id"]))
+    assert [result["custom_id"] for result in results] == ["/icons/test/a.png", "/icons/test/b.png"]
+    for result in results:
+        data, error = result_image(result)
+        assert error is None
+        with Image.open(io.BytesIO(data)) as image:
+            assert (image.size, image.mode) == ((64, 32), "RGBA")
+
+
+def test_result_image_reports_failures():
+    assert result_image({"error": {"message": "expired"}}) == (None, "expired")
+    assert result_image({"response": {"status_code": 400, "body": {"error": "bad size"}}})[1].startswith("HTTP 400")
+    assert result_image({"response": {"status_code": 200, "body": {"data": []}}}) == (None, "no b64_json in response")
+
+
+def test_submit_then_collect_writes_placeholders_without_publishing(tmp_path, monkeypatch, clock):
+    monkeypatch.setattr(asset_batch, "BATCH_DIR", tmp_path / "batches")
+    monkeypatch.setattr(asset_jobs, "BATCH_DIR", tmp_path / "batches")
+    monkeypatch.setattr(asset_jobs, "ROOT_DIR", tmp_path)
+    monkeypatch.setattr(asset_jobs, "batch_client", lambda endpoint: LocalBatchClient(tmp_path / "batches" / "local"))
+    jobs = [_job("a.png", "first prompt"), _job("b.png", "second prompt")]
+
+    state, client = asset_jobs.submit_batch(jobs, {}, "local", LatencyHistory(tmp_path / "history.json"))
+    assert state.path.exists()
+    assert asset_batch.BatchState.load(state.batch_id).jobs == state.jobs
+
+    # Removed from the definitions after submission: skipped and reported as failed
+    clock.now += 2 * asset_batch.LOCAL_SECONDS_PER_REQUEST
+    asset_map = AssetMap(tmp_path / "asset-map.json")
+    successful, failed, reuses = asset_jobs.collect_batch(
+        state, client, jobs[:1], asset_map, PromptIndex(), output_dir=tmp_path / "out")
+
+    assert (successful, failed, reuses) == (["a.png"], ["b.png"], {})
+    assert (tmp_path / "out" / "icons" / "test" / "a.png").exists()
+    assert not (tmp_path / "out" / "icons" / "test" / "b.png").exists()
+    assert asset_map.assets == {}
+    assert not state.path.exists()
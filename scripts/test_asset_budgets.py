@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Tests for the asset performance budgets (asset_budgets.py)
+Run from the repository root with: python -m pytest -q scripts/
+"""
+
+import pytest
+from PIL import Image
+
+import asset_pipeline
+from asset_budgets import asset_budget, check_budgets
+from asset_pipeline import AssetMap
+
+BUDGET = {
+    "category": "nav-icon",
+    "rendered_px": 24,
+    "max_density": 2,
+    "max_bytes": {".png": 4_000, ".webp": 3_000, ".svg": 2_000},
+}
+
+
+@pytest.fixture
+def asset_map(tmp_path, monkeypatch):
+    monkeypatch.setattr(asset_pipeline, "PUBLIC_DIR", tmp_path / "public")
+    return AssetMap(tmp_path / "asset-map.json")
+
+
+def publish(asset_map, url, size=48, pad=0):
+    """Publish a real image (or SVG) at url, padded with trailing bytes to grow it"""
+    path = asset_pipeline.public_path(url)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if url.endswith(".svg"):
+        path.write_bytes(b'<svg xmlns="http://www.w3.org/2000/svg"/>' + b" " * pad)
+    else:
+        Image.new("RGBA", (size, size), (59, 130, 246, 255)).save(path, url.rsplit(".", 1)[1].upper())
+        with open(path, "ab") as f:
+            f.write(b"\0" * pad)
+    asset_map.publish(path)
+
+
+def _job(url, surface="app-shell", themes=None):
+    return {"key": url.rsplit("/", 1)[1], "url": url, "budget": BUDGET,
+            "surface": surface, "themes": themes or {}}
+
+
+def test_asset_budget_takes_the_assets_rendered_size():
+    group = {"budget": BUDGET}
+    assert asset_budget(group, {}) == BUDGET
+    assert asset_budget(group, {"rendered_px": 32})["rendered_px"] == 32
+    # The override is per asset; the group's budget is left alone
+    assert group["budget"]["rendered_px"] == 24
+
+
+def test_within_budget_without_a_traced_svg(asset_map):
+    publish(asset_map, "/icons/nav/home.png")
+    publish(asset_map, "/icons/nav/home.webp")
+
+    [(job, variants, problems)], totals, violations = check_budgets([_job("/icons/nav/home.png")], asset_map)
+
+    assert problems == [] and violations == []
+    assert variants[".png"][:2] == (48, 48)
+    assert set(variants) == {".png", ".webp"}
+    assert totals == {"app-shell": {ext: size for ext, (_, _, size) in variants.items()}}
+
+
+def test_reports_missing_oversized_and_heavy_variants(asset_map):
+    publish(asset_map, "/icons/nav/home.png", size=64)
+    publish(asset_map, "/icons/nav/home.svg", pad=3_000)
+
+    [(_, _, problems)], _, violations = check_budgets([_job("/icons/nav/home.png")], asset_map)
+
+    assert problems[0] == ".png is 64x64 px, over 48 px (24 px rendered x2)"
+    assert problems[1] == ".webp variant is not published"
+    assert problems[2].startswith(".svg is ") and problems[2].endswith("over 2.0 KB")
+    assert violations == [f"/icons/nav/home.png: {problem}" for problem in problems]
+
+
+def test_theme_variants_are_checked_but_not_totalled(asset_map):
+    for url in ["/icons/nav/home.png", "/icons/nav/home.webp", "/icons/nav/home.dark.png"]:
+        publish(asset_map, url)
+    publish(asset_map, "/icons/nav/home.dark.webp", pad=4_000)
+
+    [(_, variants, problems)], totals, _ = check_budgets(
+        [_job("/icons/nav/home.png", themes={"dark": {"chroma": 0.85}})], asset_map)
+
+    assert len(problems) == 1 and problems[0].startswith("dark .webp is ")
+    base = asset_map.get("/icons/nav/home.webp")["bytes"]
+    assert totals["app-shell"][".webp"] == base == variants[".webp"][2]
+
+
+def test_surface_totals_against_surface_budgets(asset_map):
+    jobs = [_job("/icons/nav/home.png"), _job("/icons/nav/files.png"),
+            _job("/graphics/hero.png", surface="splash")]
+    for job in jobs:
+        publish(asset_map, job["url"])
+        publish(asset_map, job["url"].replace(".png", ".webp"))
+
+    png = {url: asset_map.get(url)["bytes"] for url in ["/icons/nav/home.png", "/icons/nav/files.png"]}
+    _, totals, violations = check_budgets(jobs, asset_map, {
+        "app-shell": {".png": sum(png.values()) - 1},
+        "splash": {".png": 100_000},
+    })
+
+    assert totals["app-shell"][".png"] == sum(png.values())
+    assert set(totals) == {"app-shell", "splash"}
+    assert len(violations) == 1 and violations[0].startswith("surface app-shell: .png total ")
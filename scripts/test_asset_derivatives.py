@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Tests for served derivatives and theme variants (asset_derivatives.py)
+Run from the repository root with: python -m pytest -q scripts/
+"""
+
+import numpy as np
+from PIL import Image
+
+import image_kernels
+from asset_derivatives import derived_size, themed_svg
+
+DARK = {"lightness": (0.55, 0.95), "chroma": 0.85}
+
+GRADIENT_SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 256 256">'
+    '<defs><linearGradient id="nav-home-fill" x2="1" y2="1">'
+    '<stop stop-color="#3b82f6"/><stop offset="1" stop-color="#8b5cf6"/>'
+    '</linearGradient></defs>'
+    '<path fill="url(#nav-home-fill)" fill-rule="evenodd" d="M0 0h4v4h-4z"/></svg>'
+)
+
+
+def test_derived_size_never_upscales_the_master():
+    budget = {"rendered_px": 24, "max_density": 2}
+    assert derived_size(budget, 1024) == 48
+    assert derived_size(budget, 32) == 32
+
+
+def test_themed_svg_matches_the_recolored_raster():
+    themed = themed_svg(GRADIENT_SVG, "dark", DARK)
+
+    swatch = Image.fromarray(np.array([[[59, 130, 246, 255], [139, 92, 246, 255]]], dtype=np.uint8), "RGBA")
+    start, end = ("#" + bytes(rgba[:3]).hex() for rgba in np.asarray(image_kernels.recolor(swatch, **DARK))[0])
+    assert f'<stop stop-color="{start}"/><stop offset="1" stop-color="{end}"/>' in themed
+    assert "#3b82f6" not in themed and "#8b5cf6" not in themed
+
+
+def test_themed_svg_renames_gradient_ids():
+    themed = themed_svg(GRADIENT_SVG, "dark", DARK)
+    # Both themes can be inlined on one page without their gradients colliding
+    assert 'id="nav-home-dark-fill"' in themed
+    assert 'fill="url(#nav-home-dark-fill)"' in themed
+    assert "nav-home-fill" not in themed
+
+
+def test_themed_svg_without_colors_is_unchanged():
+    svg = '<svg xmlns="http://www.w3.org/2000/svg"><path d="M0 0h4v4h-4z"/></svg>'
+    assert themed_svg(svg, "dark", DARK) == svg
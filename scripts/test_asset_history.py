@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Tests for the latency history and run estimates (asset_history.py)
+Run from the repository root with: python -m pytest -q scripts/
+"""
+
+import pytest
+
+from asset_history import LatencyHistory
+
+
+def _job(key, model, size, quality):
+    return {"key": key, "model": model, "size": size, "quality": quality}
+
+
+def test_estimate_schedules_longest_first_with_dispatch_spacing(tmp_path):
+    history = LatencyHistory(tmp_path / "history.json")
+    history.record("gpt-image-1", "1024x1024", "high", 10.0, 2_000)
+    history.record("gpt-image-1", "1024x1024", "low", 6.0, 1_000)
+    history.record("test-model", "1x1", "q", 4.0, 500)
+    jobs = [
+        _job("c", "test-model", "1x1", "q"),
+        _job("b", "gpt-image-1", "1024x1024", "low"),
+        _job("d", "test-model", "1x1", "q"),
+        _job("a", "gpt-image-1", "1024x1024", "high"),
+    ]
+
+    assert [job["key"] for job in history.order(jobs)][:2] == ["a", "b"]
+
+    # a: 0-10 | b: 1-7 | c: 7-11 on b's worker | d: 10-14 on a's worker
+    estimate = history.estimate(jobs, concurrency=2, dispatch_interval=1.0)
+    assert estimate["wall_seconds"] == pytest.approx(14.0)
+    assert estimate["serial_seconds"] == pytest.approx(24.0)
+    assert estimate["cost"] == pytest.approx(0.167 + 0.011)
+    assert estimate["bytes"] == 2_000 + 1_000 + 500 + 500
+    assert estimate["unpriced"] == ["test-model|1x1|q"]
+
+    # Dispatch spacing alone sets the floor when renders are instant next to it
+    assert history.estimate(jobs, concurrency=4, dispatch_interval=100.0)["wall_seconds"] == pytest.approx(304.0)
+
+
+def test_history_round_trips_through_save(tmp_path):
+    history = LatencyHistory(tmp_path / "cache" / "history.json")
+    history.record("gpt-image-1", "1024x1024", "high", 10.0, 2_000)
+    history.save()
+
+    reloaded = LatencyHistory(tmp_path / "cache" / "history.json")
+    assert reloaded.samples == history.samples
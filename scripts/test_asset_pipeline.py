@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Tests for the fingerprinting asset map (asset_pipeline.py)
+Run from the repository root with: python -m pytest -q scripts/
+"""
+
+import pytest
+
+import asset_pipeline
+from asset_pipeline import AssetMap, content_hash
+
+
+@pytest.fixture
+def public_dir(tmp_path, monkeypatch):
+    public = tmp_path / "public"
+    monkeypatch.setattr(asset_pipeline, "PUBLIC_DIR", public)
+    return public
+
+
+def write(public_dir, url, data):
+    path = public_dir / url.lstrip("/")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return path
+
+
+def test_publish_moves_the_file_to_its_content_hash(public_dir, tmp_path):
+    asset_map = AssetMap(tmp_path / "asset-map.json")
+    source = write(public_dir, "/icons/nav/home.png", b"first")
+
+    target = asset_map.publish(source)
+
+    digest = content_hash(b"first")
+    assert target == public_dir / "icons" / "nav" / f"home.{digest[:8]}.png"
+    assert target.read_bytes() == b"first"
+    assert not source.exists()
+    assert asset_map.get("/icons/nav/home.png") == {
+        "url": f"/icons/nav/home.{digest[:8]}.png", "hash": digest, "bytes": 5,
+    }
+    assert asset_map.resolve("/icons/nav/home.png") == target
+
+
+def test_republish_replaces_the_previous_revision(public_dir, tmp_path):
+    asset_map = AssetMap(tmp_path / "asset-map.json")
+    first = asset_map.publish(write(public_dir, "/icons/nav/home.png", b"first"))
+    second = asset_map.publish(write(public_dir, "/icons/nav/home.png", b"second"))
+
+    assert not first.exists()
+    assert second.read_bytes() == b"second"
+    assert asset_map.get("/icons/nav/home.png")["hash"] == content_hash(b"second")
+
+    # Unchanged bytes land on the same name and keep it
+    assert asset_map.publish(write(public_dir, "/icons/nav/home.png", b"second")) == second
+    assert second.exists()
+
+
+def test_publish_under_another_logical_url(public_dir, tmp_path):
+    asset_map = AssetMap(tmp_path / "asset-map.json")
+    source = write(public_dir, "/tmp/render.png", b"render")
+
+    target = asset_map.publish(source, "/icons/brand/logo.png")
+
+    assert target.parent == public_dir / "icons" / "brand"
+    assert asset_map.get("/icons/brand/logo.png")["hash"] == content_hash(b"render")
+    assert asset_map.get("/tmp/render.png") is None
+
+
+def test_unpublish_drops_the_entry_and_its_file(public_dir, tmp_path):
+    asset_map = AssetMap(tmp_path / "asset-map.json")
+    target = asset_map.publish(write(public_dir, "/icons/nav/home.png", b"first"))
+
+    asset_map.unpublish("/icons/nav/home.png")
+    assert asset_map.get("/icons/nav/home.png") is None
+    assert not target.exists()
+    assert asset_map.resolve("/icons/nav/home.png") is None
+
+    # Unknown URLs are a no-op
+    asset_map.unpublish("/icons/nav/missing.png")
+
+
+def test_resolve_ignores_entries_whose_file_is_gone(public_dir, tmp_path):
+    asset_map = AssetMap(tmp_path / "asset-map.json")
+    asset_map.publish(write(public_dir, "/icons/nav/home.png", b"first")).unlink()
+    assert asset_map.resolve("/icons/nav/home.png") is None
+
+
+def _entry(url, nbytes, surface="app-shell"):
+    entry = {"url": url, "hash": f"{nbytes:08x}" + "0" * 56, "bytes": nbytes}
+    if surface:
+        entry["surface"] = surface
+    return entry
+
+
+def test_precache_entries_group_raster_formats_under_the_png(tmp_path):
+    asset_map = AssetMap(tmp_path / "asset-map.json")
+    asset_map.assets = {
+        "/icons/brand/logo.png": _entry("/icons/brand/logo.aaaa.png", 300),
+        "/icons/brand/logo.webp": _entry("/icons/brand/logo.bbbb.webp", 200),
+        "/icons/brand/logo.avif": _entry("/icons/brand/logo.cccc.avif", 100),
+    }
+
+    [entry] = asset_map.precache_entries()
+    assert entry["url"] == "/icons/brand/logo.aaaa.png"
+    assert entry["bytes"] == 300
+    # Smallest first, so the service worker takes the first type it can decode
+    assert [(v["type"], v["bytes"]) for v in entry["variants"]] == [
+        ("image/avif", 100), ("image/webp", 200), ("image/png", 300),
+    ]
+
+
+def test_precache_entries_keep_only_what_the_app_shell_loads(tmp_path):
+    asset_map = AssetMap(tmp_path / "asset-map.json")
+    asset_map.assets = {
+        # Traced icon: the app loads the SVG, never the rasters
+        "/icons/nav/home.png": _entry("/icons/nav/home.aaaa.png", 300),
+        "/icons/nav/home.webp": _entry("/icons/nav/home.bbbb.webp", 200),
+        "/icons/nav/home.svg": _entry("/icons/nav/home.cccc.svg", 150),
+        # Theme variants load only where a component asks for them
+        "/icons/nav/home.dark.png": _entry("/icons/nav/home.dark.dddd.png", 300),
+        "/icons/nav/home.dark.svg": _entry("/icons/nav/home.dark.eeee.svg", 150),
+        # Other surfaces, and entries published before surfaces were recorded
+        "/graphics/megamenu/hero.png": _entry("/graphics/megamenu/hero.ffff.png", 9_000, "megamenu"),
+        "/icons/nav/sprite.svg": _entry("/icons/nav/sprite.9999.svg", 900, None),
+    }
+
+    entries = asset_map.precache_entries()
+    assert [entry["url"] for entry in entries] == ["/icons/nav/home.cccc.svg"]
+    assert entries[0]["variants"] == [
+        {"url": "/icons/nav/home.cccc.svg", "type": "image/svg+xml", "bytes": 150},
+    ]
+
+
+def test_publish_records_the_surface(public_dir, tmp_path):
+    asset_map = AssetMap(tmp_path / "asset-map.json")
+    asset_map.publish(write(public_dir, "/icons/nav/home.png", b"first"), surface="app-shell")
+    assert asset_map.get("/icons/nav/home.png")["surface"] == "app-shell"
+    assert len(asset_map.precache_entries()) == 1
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Tests for the on-demand variant server's caches (asset_server.py)
+Run from the repository root with: python -m pytest -q scripts/
+"""
+
+import threading
+
+from asset_server import MemoryLRU, SingleFlight
+
+KEY = "nav-home-24-48.png"
+
+
+class ArrivalEvent(threading.Event):
+    """An in-flight call's done event that counts the followers waiting on it"""
+
+    def __init__(self):
+        super().__init__()
+        self.arrived = threading.Semaphore(0)
+
+    def wait(self, timeout=None):
+        self.arrived.release()
+        return super().wait(timeout)
+
+
+def lead(flight, request, build_started):
+    """Start the leading request and hold it in its build; returns (thread, arrivals)"""
+    leader = threading.Thread(target=request)
+    leader.start()
+    assert build_started.wait(5)
+    # Followers look the event up after taking the call, so swapping it now sees all of them
+    done = flight._calls[KEY]["done"] = ArrivalEvent()
+    return leader, done.arrived
+
+
+def test_single_flight_coalesces_concurrent_calls():
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+    results = []
+
+    def build():
+        calls.append(1)
+        started.set()
+        assert release.wait(5)
+        return b"variant"
+
+    def request():
+        results.append(flight.do(KEY, build))
+
+    leader, arrived = lead(flight, request, started)
+    followers = [threading.Thread(target=request) for _ in range(4)]
+    for thread in followers:
+        thread.start()
+    # The build only finishes once every follower is waiting on it
+    for _ in followers:
+        assert arrived.acquire(timeout=5)
+    release.set()
+    for thread in [leader, *followers]:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert sorted(results, key=lambda result: result[1]) == [(b"variant", False)] + [(b"variant", True)] * 4
+
+    # Finished calls aren't cached; the next caller builds again
+    assert flight.do(KEY, build) == (b"variant", False)
+    assert len(calls) == 2
+
+
+def test_single_flight_shares_errors():
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    errors = []
+
+    def build():
+        started.set()
+        assert release.wait(5)
+        raise RuntimeError("render failed")
+
+    def request():
+        try:
+            flight.do(KEY, build)
+        except RuntimeError as e:
+            errors.append(str(e))
+
+    leader, arrived = lead(flight, request, started)
+    follower = threading.Thread(target=request)
+    follower.start()
+    assert arrived.acquire(timeout=5)
+    release.set()
+    for thread in [leader, follower]:
+        thread.join(5)
+
+    assert errors == ["render failed", "render failed"]
+    assert flight._calls == {}
+
+
+def test_memory_lru_evicts_least_recently_used():
+    cache = MemoryLRU(max_bytes=10)
+    cache.put("a", b"aaaa")
+    cache.put("b", b"bbbb")
+    assert cache.get("a") == b"aaaa"   # a is now the most recent
+
+    cache.put("c", b"cccc")
+    assert cache.get("b") is None
+    assert cache.get("a") == b"aaaa"
+    assert cache.get("c") == b"cccc"
+    assert cache.bytes == 8
+
+    # Replacing a key only counts its new size
+    cache.put("a", b"aa")
+    assert cache.bytes == 6
+
+    # Items larger than the whole cache are never stored
+    cache.put("huge", b"x" * 11)
+    assert cache.get("huge") is None
+    assert cache.bytes == 6
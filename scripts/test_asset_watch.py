@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Tests for the --watch definition diff and reload (asset_watch.py)
+Run from the repository root with: python -m pytest -q scripts/
+"""
+
+from asset_watch import DefinitionWatcher, diff_jobs
+
+
+def _watch_job(url, prompt="prompt", budget=None, themes=None, vectorize=False, sprite=None,
+               surface="app-shell"):
+    return {"url": url, "prompt": prompt, "model": "gpt-image-1", "size": "1024x1024", "quality": "high",
+            "budget": budget or {"rendered_px": 24}, "themes": themes or {},
+            "vectorize": vectorize, "sprite": sprite, "surface": surface}
+
+
+def test_diff_jobs_splits_renders_rederives_and_removals():
+    previous = [
+        _watch_job("/unchanged.png"),
+        _watch_job("/prompt.png"),
+        _watch_job("/budget.png"),
+        _watch_job("/theme.png"),
+        _watch_job("/vectorize.png"),
+        _watch_job("/sprite.png"),
+        _watch_job("/surface.png"),
+        _watch_job("/removed.png"),
+    ]
+    current = [
+        _watch_job("/unchanged.png"),
+        _watch_job("/prompt.png", prompt="edited"),
+        _watch_job("/budget.png", budget={"rendered_px": 32}),
+        _watch_job("/theme.png", themes={"dark": {"chroma": 0.85}}),
+        _watch_job("/vectorize.png", vectorize=True),
+        _watch_job("/sprite.png", sprite="/icons/navigation/nav-sprite.svg"),
+        _watch_job("/surface.png", surface="megamenu"),
+        _watch_job("/added.png"),
+    ]
+
+    to_render, to_derive, removed = diff_jobs(previous, current)
+    assert [job["url"] for job in to_render] == ["/prompt.png", "/added.png"]
+    assert [job["url"] for job in to_derive] == [
+        "/budget.png", "/theme.png", "/vectorize.png", "/sprite.png", "/surface.png",
+    ]
+    assert removed == ["/removed.png"]
+
+
+def test_a_render_edit_wins_over_a_derive_edit():
+    to_render, to_derive, _ = diff_jobs(
+        [_watch_job("/icon.png")], [_watch_job("/icon.png", prompt="edited", vectorize=True)])
+    assert [job["url"] for job in to_render] == ["/icon.png"]
+    assert to_derive == []
+
+
+def test_load_does_not_run_main(tmp_path):
+    script = tmp_path / "generate-test.py"
+    script.write_text(
+        "ASSETS = ['a.png']\n"
+        "if __name__ == '__main__':\n"
+        "    raise SystemExit('main ran')\n"
+    )
+    assert DefinitionWatcher(script).load()["ASSETS"] == ["a.png"]
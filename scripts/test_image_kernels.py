@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Tests for the local image kernels (image_kernels.py)
+Run from the repository root with: python -m pytest -q scripts/
+"""
+
+import numpy as np
+from PIL import Image
+
+import image_kernels
+
+
+def _image(*pixels):
+    return Image.fromarray(np.array([pixels], dtype=np.uint8), "RGBA")
+
+
+def _pixels(image):
+    return np.asarray(image).astype(int)
+
+
+def test_recolor_with_default_params_is_the_identity():
+    rng = np.random.default_rng(7)
+    pixels = rng.integers(0, 256, (16, 16, 4), dtype=np.uint8)
+    pixels[..., 3] = np.maximum(pixels[..., 3], 1)
+    image = Image.fromarray(pixels, "RGBA")
+
+    for params in [{}, {"hue_shift": 360.0}]:
+        result = _pixels(image_kernels.recolor(image, **params))
+        assert np.abs(result[..., :3] - pixels[..., :3]).max() <= 1
+        assert np.array_equal(result[..., 3], pixels[..., 3])
+
+
+def test_recolor_leaves_alpha_and_clears_transparent_pixels():
+    result = _pixels(image_kernels.recolor(_image((59, 130, 246, 128), (200, 10, 10, 0)), chroma=0.5))
+    assert result[0, 0, 3] == 128
+    assert result[0, 1].tolist() == [0, 0, 0, 0]
+
+
+def test_recolor_chroma_and_lightness():
+    blue, black, white = (59, 130, 246, 255), (0, 0, 0, 255), (255, 255, 255, 255)
+
+    # No chroma left: every color becomes a neutral gray
+    gray = _pixels(image_kernels.recolor(_image(blue), chroma=0.0))[0, 0, :3]
+    assert gray.max() - gray.min() <= 1
+
+    # The dark theme's range lifts black and dims white, keeping them neutral
+    lifted, dimmed = _pixels(image_kernels.recolor(_image(black, white), lightness=(0.55, 0.95)))[0, :, :3]
+    assert lifted.max() - lifted.min() <= 1 and 100 < lifted[0] < 140
+    assert dimmed.max() - dimmed.min() <= 1 and 220 < dimmed[0] < 250
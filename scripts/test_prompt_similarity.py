@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Tests for near-duplicate prompt detection (prompt_similarity.py)
+Run from the repository root with: python -m pytest -q scripts/
+"""
+
+import runpy
+from itertools import combinations
+from pathlib import Path
+
+import pytest
+
+from prompt_similarity import DUPLICATE_THRESHOLD, PromptIndex, jaccard, shingles
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+
+
+@pytest.fixture(scope="module")
+def icon_prompts():
+    definitions = runpy.run_path(str(SCRIPTS_DIR / "generate-icons.py"), run_name="asset_definitions")
+    return {key: config["prompt"] for group in definitions["ASSET_GROUPS"]
+            for key, config in group["assets"].items()}
+
+
+def test_logo_and_ai_size_variants_are_near_duplicates(icon_prompts):
+    index = PromptIndex()
+    for key, prompt in icon_prompts.items():
+        index.add(key, prompt)
+
+    def matches(key):
+        return {match for match, _ in index.query(icon_prompts[key], exclude=key)}
+
+    assert matches("peak-logo-32.png") == {"peak-logo-64.png", "peak-logo-512.png"}
+    assert matches("peak-ai-32.png") == {"peak-ai-64.png"}
+    assert matches("peak-ai-64.png") == {"peak-ai-32.png"}
+    for key in icon_prompts:
+        if key.startswith("nav-"):
+            assert matches(key) == set()
+
+
+def test_lsh_finds_every_pair_over_the_threshold(icon_prompts):
+    """Bucketing may only drop candidates that exact Jaccard would reject anyway"""
+    index = PromptIndex()
+    for key, prompt in icon_prompts.items():
+        index.add(key, prompt)
+
+    for a, b in combinations(icon_prompts, 2):
+        if jaccard(shingles(icon_prompts[a]), shingles(icon_prompts[b])) >= DUPLICATE_THRESHOLD:
+            assert b in {key for key, _ in index.query(icon_prompts[a], exclude=a)}
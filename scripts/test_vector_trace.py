@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Tests for raster-to-SVG tracing (vector_trace.py)
+Run from the repository root with: python -m pytest -q scripts/
+"""
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+import vector_trace
+
+
+def test_trace_then_rasterize_is_exact():
+    mask = np.zeros((32, 32), dtype=bool)
+    mask[4:20, 4:20] = True
+    mask[8:16, 8:16] = False      # hole
+    mask[24:30, 2:30] = True
+    mask[2, 28] = True            # single pixel
+    mask[20, 20] = True           # touches the ring's corner diagonally
+
+    loops = vector_trace.trace_loops(mask)
+    assert np.array_equal(vector_trace.rasterize(loops, 32), mask)
+
+
+def test_trace_then_rasterize_is_exact_on_noise():
+    mask = np.random.default_rng(1729).random((48, 48)) > 0.5
+    loops = vector_trace.trace_loops(mask)
+    assert np.array_equal(vector_trace.rasterize(loops, 48), mask)
+
+
+def test_path_data_uses_relative_axis_commands():
+    assert vector_trace.path_data([[(2, 2), (6, 2), (6, 5), (2, 5)]]) == "M2 2h4v3h-4z"
+    assert vector_trace.path_data([[(0, 0), (3, -1), (1, 4)]]) == "M0 0l3-1l-2 5z"
+
+
+def test_vectorize_a_flat_disc_passes_the_fidelity_check():
+    image = Image.new("RGBA", (vector_trace.TRACE_SIZE,) * 2, (0, 0, 0, 0))
+    ImageDraw.Draw(image).ellipse((40, 40, 216, 216), fill=(59, 130, 246, 255))
+
+    svg, check = vector_trace.vectorize(image, "disc", check_px=48)
+
+    assert check["passed"]
+    assert check["color_error"] < 1
+    assert 'fill="#3b82f6"' in svg and "<defs>" not in svg
+
+    sprite = vector_trace.symbol_sprite({"disc": svg})
+    assert sprite.startswith('<svg xmlns="http://www.w3.org/2000/svg"><symbol id="disc" viewBox="0 0 256 256">')
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Raster-to-SVG tracing for the flat Peak AI navigation and brand icons
+Thresholds alpha, follows pixel-edge contours, simplifies them with
+Ramer-Douglas-Peucker and checks the result against the raster before use
+"""
+
+import re
+
+import numpy as np
+from PIL import Image
+
+from asset_profiling import stage
+
+# Masters are traced at this size, which is also the SVG viewBox
+TRACE_SIZE = 256
+ALPHA_THRESHOLD = 128
+
+# Max deviation of a simplified path from the traced pixel edges, in viewBox units
+SIMPLIFY_TOLERANCE = 1.0
+# Loops enclosing less area than this are alpha specks, not shape
+MIN_LOOP_AREA = 6
+
+# Fidelity limits, checked at the pixel size the raster is served at: coverage
+# the re-rasterized paths gain or lose, as a fraction of the raster's own alpha
+# coverage, and mean RGB distance between the fill and the raster's colors
+MAX_COVERAGE_ERROR = 0.12
+MAX_COLOR_ERROR = 32.0
+
+# RGB distance between the two diagonal ends of an icon that earns a gradient
+GRADIENT_DELTA = 24.0
+
+
+def trace_loops(mask):
+    """
+    Follow the pixel-edge boundary of a boolean mask into closed loops
+
+    Edges are oriented clockwise around filled pixels, so outlines and holes
+    come out with opposite winding.
+
+    Returns:
+        [[(x, y), ...]] vertex loops on the pixel-corner grid
+    """
+    padded = np.pad(mask, 1)
+    inside = padded[1:-1, 1:-1]
+    sides = [
+        # (outside neighbour, start offset, end offset)
+        (~padded[:-2, 1:-1], (0, 0), (1, 0)),   # top
+        (~padded[1:-1, 2:], (1, 0), (1, 1)),    # right
+        (~padded[2:, 1:-1], (1, 1), (0, 1)),    # bottom
+        (~padded[1:-1, :-2], (0, 1), (0, 0)),   # left
+    ]
+
+    next_points = {}
+    for outside, (sx, sy), (ex, ey) in sides:
+        ys, xs = np.nonzero(inside & outside)
+        for x, y in zip(xs.tolist(), ys.tolist()):
+            next_points.setdefault((x + sx, y + sy), []).append((x + ex, y + ey))
+
+    loops = []
+    while next_points:
+        start = next(iter(next_points))
+        loop = [start]
+        point = start
+        while True:
+            ends = next_points[point]
+            end = ends.pop()
+            if not ends:
+                del next_points[point]
+            if end == start:
+                break
+            loop.append(end)
+            point = end
+        loops.append(_corners(loop))
+    return loops
+
+
+def _corners(loop):
+    """Drop vertices in the middle of straight runs"""
+    kept = []
+    count = len(loop)
+    for i, (x, y) in enumerate(loop):
+        px, py = loop[i - 1]
+        nx, ny = loop[(i + 1) % count]
+        if (x - px, y - py) != (nx - x, ny - y):
+            kept.append((x, y))
+    return kept
+
+
+def loop_area(loop):
+    """Signed shoelace area"""
+    points = np.asarray(loop, dtype=np.float64)
+    x, y = points[:, 0], points[:, 1]
+    return 0.5 * float(np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1)))
+
+
+def _rdp(points, tolerance):
+    """Ramer-Douglas-Peucker over an open polyline; keeps both endpoints"""
+    keep = np.zeros(len(points), dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(points) - 1)]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+        start, end = points[first], points[last]
+        segment = end - start
+        length = np.hypot(*segment)
+        offsets = points[first + 1:last] - start
+        if length == 0:
+            distances = np.hypot(offsets[:, 0], offsets[:, 1])
+        else:
+            distances = np.abs(segment[0] * offsets[:, 1] - segment[1] * offsets[:, 0]) / length
+        index = int(np.argmax(distances))
+        if distances[index] > tolerance:
+            split = first + 1 + index
+            keep[split] = True
+            stack += [(first, split), (split, last)]
+    return points[keep]
+
+
+def simplify(loop, tolerance=SIMPLIFY_TOLERANCE):
+    """Simplify a closed loop, split at the vertex farthest from its start"""
+    points = np.asarray(loop, dtype=np.float64)
+    if len(points) <= 4:
+        return loop
+    far = int(np.argmax(np.hypot(*(points - points[0]).T)))
+    first = _rdp(points[:far + 1], tolerance)
+    second = _rdp(np.vstack([points[far:], points[:1]]), tolerance)
+    merged = np.vstack([first, second[1:-1]])
+    return [(int(x), int(y)) for x, y in merged]
+
+
+def rasterize(loops, size):
+    """
+    Even-odd scanline fill of vertex loops back to a boolean mask
+
+    A pixel is inside when an odd number of edges cross its row to the right of
+    its centre, which is how the SVG's fill-rule="evenodd" renders it.
+    """
+    centers = np.arange(size) + 0.5
+    mask = np.zeros((size, size), dtype=bool)
+    for loop in loops:
+        points = np.asarray(loop, dtype=np.float64)
+        for (x0, y0), (x1, y1) in zip(points, np.roll(points, -1, axis=0)):
+            if y0 == y1:
+                continue
+            rows = np.nonzero((centers >= min(y0, y1)) & (centers < max(y0, y1)))[0]
+            if not rows.size:
+                continue
+            crossings = x0 + (centers[rows] - y0) * (x1 - x0) / (y1 - y0)
+            mask[rows] ^= centers[None, :] < crossings[:, None]
+    return mask
+
+
+def coverage_error(alpha, loops, size):
+    """
+    Alpha the traced paths get wrong once both are box-filtered to `size` px
+
+    Returns:
+        Absolute coverage difference as a fraction of the raster's coverage
+    """
+    traced = rasterize(loops, alpha.shape[0]).astype(np.uint8) * 255
+    raster = np.asarray(Image.fromarray(alpha).resize((size, size), Image.Resampling.BOX), np.float64)
+    traced = np.asarray(Image.fromarray(traced).resize((size, size), Image.Resampling.BOX), np.float64)
+    total = raster.sum()
+    return float(np.abs(raster - traced).sum() / total) if total else 0.0
+
+
+def fill_colors(pixels, mask):
+    """
+    One color, or a top-left to bottom-right gradient when the ends differ
+
+    Returns:
+        ([start rgb, end rgb] (equal for a flat fill), mean RGB error of that fill)
+    """
+    ys, xs = np.nonzero(mask)
+    rgb = pixels[ys, xs, :3].astype(np.float64)
+    diagonal = (xs + ys).astype(np.float64)
+    low, high = np.percentile(diagonal, [20, 80])
+    start = rgb[diagonal <= low].mean(axis=0)
+    end = rgb[diagonal >= high].mean(axis=0)
+
+    if np.linalg.norm(start - end) < GRADIENT_DELTA:
+        start = end = rgb.mean(axis=0)
+        predicted = np.broadcast_to(start, rgb.shape)
+    else:
+        # Matches x1=0 y1=0 x2=1 y2=1 over the shape's bounding box
+        span = diagonal.max() - diagonal.min() or 1.0
+        t = ((diagonal - diagonal.min()) / span)[:, None]
+        predicted = start * (1 - t) + end * t
+    error = float(np.linalg.norm(rgb - predicted, axis=1).mean())
+    return [start, end], error
+
+
+def _hex(rgb):
+    return "#" + "".join(f"{int(round(c)):02x}" for c in rgb)
+
+
+def _numbers(values):
+    """Join path numbers, letting minus signs double as separators"""
+    text = ""
+    for value in values:
+        text += ("" if value < 0 or not text else " ") + str(value)
+    return text
+
+
+def path_data(loops):
+    """Compact relative path commands, with h/v for axis-aligned runs"""
+    parts = []
+    for loop in loops:
+        x, y = loop[0]
+        parts.append(f"M{_numbers([x, y])}")
+        for nx, ny in loop[1:]:
+            dx, dy = nx - x, ny - y
+            if dy == 0:
+                parts.append(f"h{dx}")
+            elif dx == 0:
+                parts.append(f"v{dy}")
+            else:
+                parts.append(f"l{_numbers([dx, dy])}")
+            x, y = nx, ny
+        parts.append("z")
+    return "".join(parts)
+
+
+def vectorize(image, name, check_px):
+    """
+    Trace a square RGBA icon into a standalone SVG
+
+    Args:
+        image: Square RGBA master
+        name: Used for element ids, so several icons can share a page or sprite
+        check_px: Pixel size the fidelity check compares at (the served raster's)
+
+    Returns:
+        (svg text, {"coverage_error": ..., "color_error": ..., "passed": bool})
+    """
+    with stage("vectorize"):
+        if image.width != TRACE_SIZE:
+            image = image.resize((TRACE_SIZE, TRACE_SIZE), Image.Resampling.LANCZOS)
+        pixels = np.asarray(image)
+        mask = pixels[..., 3] >= ALPHA_THRESHOLD
+
+        loops = [
+            simplify(loop)
+            for loop in trace_loops(mask)
+            if abs(loop_area(loop)) >= MIN_LOOP_AREA
+        ]
+        loops = [loop for loop in loops if len(loop) >= 3]
+
+        shape_error = coverage_error(pixels[..., 3], loops, check_px)
+        (start, end), color_error = fill_colors(pixels, mask) if mask.any() else ([(0, 0, 0)] * 2, 0.0)
+
+        defs = ""
+        if _hex(start) == _hex(end):
+            fill = _hex(start)
+        else:
+            gradient_id = f"{name}-fill"
+            defs = (f'<defs><linearGradient id="{gradient_id}" x2="1" y2="1">'
+                    f'<stop stop-color="{_hex(start)}"/><stop offset="1" stop-color="{_hex(end)}"/>'
+                    f'</linearGradient></defs>')
+            fill = f"url(#{gradient_id})"
+
+        svg = (f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {TRACE_SIZE} {TRACE_SIZE}">'
+               f'{defs}<path fill="{fill}" fill-rule="evenodd" d="{path_data(loops)}"/></svg>')
+        return svg, {
+            "coverage_error": shape_error,
+            "color_error": color_error,
+            "passed": shape_error <= MAX_COVERAGE_ERROR and color_error <= MAX_COLOR_ERROR,
+        }
+
+
+_SVG_PATTERN = re.compile(r'<svg [^>]*viewBox="([^"]+)"[^>]*>(.*)</svg>', re.S)
+
+
+def symbol_sprite(svgs):
+    """
+    Combine standalone SVGs from vectorize() into one <symbol> sprite
+
+    Args:
+        svgs: {symbol id: svg text}; use as <svg><use href="sprite.svg#id"/></svg>
+    """
+    symbols = []
+    for symbol_id, svg in sorted(svgs.items()):
+        view_box, body = _SVG_PATTERN.match(svg).groups()
+        symbols.append(f'<symbol id="{symbol_id}" viewBox="{view_box}">{body}</symbol>')
+    return f'<svg xmlns="http://www.w3.org/2000/svg">{"".join(symbols)}</svg>'